@@ -40,11 +40,26 @@ resource "aws_iam_role_policy_attachment" "bedrock_full_access" {
   policy_arn = "arn:aws:iam::aws:policy/AmazonBedrockFullAccess"
 }
 
-# Create deployment package
+# Create deployment package: the handler directory plus the shared common_libs package
 data "archive_file" "lambda_zip" {
   type        = "zip"
-  source_file = var.lambda_source_file
   output_path = "${path.module}/deployment.zip"
+
+  dynamic "source" {
+    for_each = fileset(var.lambda_source_dir, "*.py")
+    content {
+      content  = file("${var.lambda_source_dir}/${source.value}")
+      filename = source.value
+    }
+  }
+
+  dynamic "source" {
+    for_each = fileset(var.common_libs_source_dir, "*.py")
+    content {
+      content  = file("${var.common_libs_source_dir}/${source.value}")
+      filename = "common_libs/${source.value}"
+    }
+  }
 }
 
 # Lambda function
@@ -61,7 +76,8 @@ resource "aws_lambda_function" "todoist_tool" {
 
   environment {
     variables = {
-      TODOIST_SECRET_NAME = var.todoist_secret_name
+      TODOIST_SECRET_NAME                 = var.todoist_secret_name
+      TODOIST_TENANT_SECRET_NAME_TEMPLATE = var.todoist_tenant_secret_name_template
     }
   }
 
@@ -3,8 +3,13 @@ variable "environment" {
   type        = string
 }
 
-variable "lambda_source_file" {
-  description = "Path to Lambda Python source file"
+variable "lambda_source_dir" {
+  description = "Path to the Todoist tool Lambda source directory"
+  type        = string
+}
+
+variable "common_libs_source_dir" {
+  description = "Path to the shared common_libs package bundled into the Lambda"
   type        = string
 }
 
@@ -13,6 +18,12 @@ variable "todoist_secret_name" {
   type        = string
 }
 
+variable "todoist_tenant_secret_name_template" {
+  description = "Secret name template for per-tenant Todoist tokens, e.g. aurora/dev/todoist/{tenant_id}. Empty disables multi-tenant requests"
+  type        = string
+  default     = ""
+}
+
 variable "lambda_layers" {
   description = "List of Lambda layer ARNs"
   type        = list(string)
@@ -8,11 +8,31 @@ locals {
   }
 }
 
-# Build Lambda deployment package
+locals {
+  user_request_handler_source_dir = "${path.root}/../../../src/domains/user_interaction/api_handlers/user_request_handler"
+  common_libs_source_dir          = "${path.root}/../../../src/domains/common_libs"
+}
+
+# Build Lambda deployment package: the handler plus the shared common_libs package
 data "archive_file" "user_request_handler" {
   type        = "zip"
-  source_dir  = "${path.root}/../../../src/domains/user_interaction/api_handlers/user_request_handler"
   output_path = "${path.module}/user_request_handler.zip"
+
+  dynamic "source" {
+    for_each = fileset(local.user_request_handler_source_dir, "*.py")
+    content {
+      content  = file("${local.user_request_handler_source_dir}/${source.value}")
+      filename = source.value
+    }
+  }
+
+  dynamic "source" {
+    for_each = fileset(local.common_libs_source_dir, "*.py")
+    content {
+      content  = file("${local.common_libs_source_dir}/${source.value}")
+      filename = "common_libs/${source.value}"
+    }
+  }
 }
 
 # Lambda Function for handling user requests
@@ -23,7 +43,7 @@ module "user_request_handler" {
   execution_role_name = "aurora-dev-ui-iam-user-request-handler-exec-role"
   handler            = "app.lambda_handler"
   runtime            = "python3.12"
-  timeout            = 60
+  timeout            = 30  # API Gateway cuts requests at ~29s; async jobs run in user_request_worker
   memory_size        = 128
   
   # Deployment package
@@ -31,8 +51,12 @@ module "user_request_handler" {
   source_code_hash = data.archive_file.user_request_handler.output_base64sha256
 
   environment_variables = {
-    BEDROCK_AGENT_ID       = var.bedrock_agent_id
-    BEDROCK_AGENT_ALIAS_ID = var.bedrock_agent_alias_id
+    BEDROCK_AGENT_ID           = var.bedrock_agent_id
+    BEDROCK_AGENT_ALIAS_ID     = var.bedrock_agent_alias_id
+    TODOIST_TOOL_FUNCTION_NAME = var.todoist_lambda_function_name
+    JOB_TABLE_NAME             = aws_dynamodb_table.agent_jobs.name
+    JOB_WORKER_FUNCTION_NAME   = module.user_request_worker.lambda_function_name
+    JOB_START_TIMEOUT_SECONDS  = 900 # Worker max event age (600) + worker timeout (300)
   }
 
   tags = merge(local.common_tags, {
@@ -40,6 +64,124 @@ module "user_request_handler" {
   })
 }
 
+# Same package as user_request_handler, invoked asynchronously to run background jobs.
+# Kept separate so only background work gets the long timeout.
+module "user_request_worker" {
+  source = "../../modules/aws_lambda_function"
+  
+  function_name       = "aurora-dev-ui-lambda-user-request-worker"
+  execution_role_name = "aurora-dev-ui-iam-user-request-worker-exec-role"
+  handler            = "app.lambda_handler"
+  runtime            = "python3.12"
+  timeout            = 300
+  memory_size        = 128
+  
+  # Deployment package
+  filename         = data.archive_file.user_request_handler.output_path
+  source_code_hash = data.archive_file.user_request_handler.output_base64sha256
+
+  environment_variables = {
+    BEDROCK_AGENT_ID           = var.bedrock_agent_id
+    BEDROCK_AGENT_ALIAS_ID     = var.bedrock_agent_alias_id
+    TODOIST_TOOL_FUNCTION_NAME = var.todoist_lambda_function_name
+    JOB_TABLE_NAME             = aws_dynamodb_table.agent_jobs.name
+  }
+
+  tags = merge(local.common_tags, {
+    Name = "aurora-dev-ui-lambda-user-request-worker"
+  })
+}
+
+# Allow the fast path to call the Todoist tool Lambda directly
+resource "aws_iam_role_policy" "user_request_handler_fast_path" {
+  for_each = {
+    handler = module.user_request_handler.lambda_execution_role_name
+    worker  = module.user_request_worker.lambda_execution_role_name
+  }
+
+  name = "fast-path-todoist-invoke-policy"
+  role = each.value
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect   = "Allow"
+        Action   = ["lambda:InvokeFunction"]
+        Resource = [var.todoist_lambda_arn]
+      }
+    ]
+  })
+}
+
+# DynamoDB table holding async agent job status, progress and results
+resource "aws_dynamodb_table" "agent_jobs" {
+  name         = "${var.project_name}-${var.environment}-ui-ddb-agent-jobs"
+  billing_mode = "PAY_PER_REQUEST"
+  hash_key     = "jobId"
+
+  attribute {
+    name = "jobId"
+    type = "S"
+  }
+
+  ttl {
+    attribute_name = "expiresAt"
+    enabled        = true
+  }
+
+  tags = merge(local.common_tags, {
+    Name = "${var.project_name}-${var.environment}-ui-ddb-agent-jobs"
+  })
+}
+
+# Background job invocations are never retried (a retry would run the agent twice) and
+# are dropped if they cannot start in time; GET /jobs/{jobId} reports both as failed
+resource "aws_lambda_function_event_invoke_config" "user_request_worker" {
+  function_name                = module.user_request_worker.lambda_function_name
+  maximum_retry_attempts       = 0
+  maximum_event_age_in_seconds = 600
+}
+
+# Allow async mode to store jobs and start the background worker
+resource "aws_iam_role_policy" "user_request_handler_async_jobs" {
+  name = "async-jobs-policy"
+  role = module.user_request_handler.lambda_execution_role_name
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect   = "Allow"
+        Action   = ["dynamodb:GetItem", "dynamodb:PutItem", "dynamodb:UpdateItem"]
+        Resource = [aws_dynamodb_table.agent_jobs.arn]
+      },
+      {
+        Effect   = "Allow"
+        Action   = ["lambda:InvokeFunction"]
+        Resource = [module.user_request_worker.lambda_function_arn]
+      }
+    ]
+  })
+}
+
+# Allow the worker to claim jobs and record progress and results
+resource "aws_iam_role_policy" "user_request_worker_jobs" {
+  name = "async-jobs-worker-policy"
+  role = module.user_request_worker.lambda_execution_role_name
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect   = "Allow"
+        Action   = ["dynamodb:GetItem", "dynamodb:UpdateItem"]
+        Resource = [aws_dynamodb_table.agent_jobs.arn]
+      }
+    ]
+  })
+}
+
 # API Gateway REST API
 resource "aws_api_gateway_rest_api" "main_public_api" {
   name        = "${var.project_name}-${var.environment}-ui-agw-main-public-api"
@@ -100,6 +242,42 @@ resource "aws_api_gateway_method_response" "lambda_response_200" {
   }
 }
 
+# API Gateway Resources for /jobs/{jobId} (async job status and results)
+resource "aws_api_gateway_resource" "jobs" {
+  rest_api_id = aws_api_gateway_rest_api.main_public_api.id
+  parent_id   = aws_api_gateway_rest_api.main_public_api.root_resource_id
+  path_part   = "jobs"
+}
+
+resource "aws_api_gateway_resource" "job" {
+  rest_api_id = aws_api_gateway_rest_api.main_public_api.id
+  parent_id   = aws_api_gateway_resource.jobs.id
+  path_part   = "{jobId}"
+}
+
+# API Gateway Method (GET)
+resource "aws_api_gateway_method" "job_get" {
+  rest_api_id   = aws_api_gateway_rest_api.main_public_api.id
+  resource_id   = aws_api_gateway_resource.job.id
+  http_method   = "GET"
+  authorization = "NONE"
+
+  request_parameters = {
+    "method.request.path.jobId" = true
+  }
+}
+
+# API Gateway Integration (GET)
+resource "aws_api_gateway_integration" "job_lambda_integration" {
+  rest_api_id = aws_api_gateway_rest_api.main_public_api.id
+  resource_id = aws_api_gateway_resource.job.id
+  http_method = aws_api_gateway_method.job_get.http_method
+
+  integration_http_method = "POST"
+  type                    = "AWS_PROXY"
+  uri                     = module.user_request_handler.lambda_function_invoke_arn
+}
+
 # Lambda Permission for API Gateway
 resource "aws_lambda_permission" "api_gateway_invoke" {
   statement_id  = "AllowExecutionFromAPIGateway"
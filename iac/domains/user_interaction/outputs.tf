@@ -19,4 +19,14 @@ output "lambda_function_arn" {
 output "lambda_function_name" {
   description = "Name of the Lambda function"
   value       = module.user_request_handler.lambda_function_name
+}
+
+output "job_worker_function_name" {
+  description = "Name of the Lambda function running async agent jobs"
+  value       = module.user_request_worker.lambda_function_name
+}
+
+output "agent_jobs_table_name" {
+  description = "Name of the DynamoDB table storing async agent jobs"
+  value       = aws_dynamodb_table.agent_jobs.name
 }
\ No newline at end of file
@@ -24,4 +24,14 @@ variable "bedrock_agent_id" {
 variable "bedrock_agent_alias_id" {
   description = "Bedrock Agent Alias ID"  
   type        = string
+}
+
+variable "todoist_lambda_function_name" {
+  description = "Name of the Todoist tool Lambda used by the fast path"
+  type        = string
+}
+
+variable "todoist_lambda_arn" {
+  description = "ARN of the Todoist tool Lambda used by the fast path"
+  type        = string
 }
\ No newline at end of file
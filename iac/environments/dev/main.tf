@@ -29,11 +29,12 @@ provider "aws" {
 module "ai_tooling" {
   source = "../../domains/ai_tooling"
 
-  environment         = var.environment
-  lambda_source_file  = var.lambda_source_file
-  todoist_secret_name = var.todoist_secret_name
-  lambda_layers       = var.lambda_layers
-  bedrock_agent_arn   = "arn:aws:bedrock:${var.aws_region}:${var.aws_account_id}:agent/*"
+  environment            = var.environment
+  lambda_source_dir      = var.lambda_source_dir
+  common_libs_source_dir = "${path.root}/../../../src/domains/common_libs"
+  todoist_secret_name    = var.todoist_secret_name
+  lambda_layers          = var.lambda_layers
+  bedrock_agent_arn      = "arn:aws:bedrock:${var.aws_region}:${var.aws_account_id}:agent/*"
 }
 
 # Agent Orchestration Domain
@@ -59,4 +60,7 @@ module "user_interaction" {
   environment = var.environment
   bedrock_agent_id       = module.agent_orchestration.bedrock_agent_id
   bedrock_agent_alias_id = module.agent_orchestration.bedrock_agent_alias_id
+
+  todoist_lambda_function_name = module.ai_tooling.lambda_function_name
+  todoist_lambda_arn           = module.ai_tooling.lambda_function_arn
 }
\ No newline at end of file
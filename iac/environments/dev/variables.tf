@@ -26,9 +26,10 @@ variable "aws_account_id" {
   type        = string
 }
 
-variable "lambda_source_file" {
-  description = "Path to Lambda Python script"
+variable "lambda_source_dir" {
+  description = "Path to the Todoist tool Lambda source directory"
   type        = string
+  default     = "../../../src/domains/ai_tooling/todoist_tool_handler"
 }
 
 variable "todoist_secret_name" {
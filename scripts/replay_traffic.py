@@ -0,0 +1,440 @@
+"""
+Aurora Assistant - Traffic Replay Load Generator
+Replays NDJSON traffic captured by TRAFFIC_CAPTURE_FILE against the Lambda
+handlers in-process, with local stand-ins for Bedrock, Secrets Manager and Todoist.
+
+Usage:
+    python scripts/replay_traffic.py capture.ndjson --concurrency 8 --rate 20
+"""
+
+import argparse
+import contextlib
+import io
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType, SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HANDLER_SOURCES = {
+    'user_request_handler': os.path.join(
+        REPO_ROOT, 'src', 'domains', 'user_interaction', 'api_handlers',
+        'user_request_handler', 'app.py'
+    ),
+    'todoist_tool_handler': os.path.join(
+        REPO_ROOT, 'src', 'domains', 'ai_tooling', 'todoist_tool_handler',
+        'lambda_function.py'
+    ),
+}
+
+# Parent of the common_libs package bundled into every deployment package
+COMMON_LIBS_PARENT = os.path.join(REPO_ROOT, 'src', 'domains')
+
+# Upper bounds (ms) of the latency histogram buckets
+HISTOGRAM_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class LocalBedrockAgentRuntime:
+    """Stand-in for the bedrock-agent-runtime client that streams a canned completion"""
+
+    def __init__(self, latency_ms: float, chunks: int = 3):
+        self.latency_ms = latency_ms
+        self.chunks = chunks
+
+    def invoke_agent(self, **params: Any) -> Dict[str, Any]:
+        return {'completion': self._stream(params.get('inputText', ''))}
+
+    def _stream(self, input_text: str) -> Iterator[Dict[str, Any]]:
+        # Spread the simulated orchestration time across the stream, like the real service
+        for i in range(self.chunks):
+            time.sleep(self.latency_ms / 1000 / self.chunks)
+            text = f"[local agent chunk {i + 1}/{self.chunks}] {input_text[:40]} "
+            yield {'chunk': {'bytes': text.encode('utf-8')}}
+
+
+class LocalSecretsManager:
+    """Stand-in for the secretsmanager client"""
+
+    def get_secret_value(self, SecretId: Optional[str] = None) -> Dict[str, Any]:
+        return {'SecretString': json.dumps({'api_token': 'local-token'})}
+
+
+class LocalLambdaClient:
+    """Stand-in for the lambda client that invokes loaded handlers in-process by function name"""
+
+    def __init__(self, functions: Dict[str, ModuleType]):
+        self.functions = functions
+
+    def invoke(
+        self, FunctionName: str, Payload: str, InvocationType: str = 'RequestResponse', **kwargs: Any
+    ) -> Dict[str, Any]:
+        handler = self.functions[FunctionName].lambda_handler
+        event = json.loads(Payload)
+
+        # Async invocations return immediately, like Lambda's event queue
+        if InvocationType == 'Event':
+            threading.Thread(target=handler, args=(event, None), daemon=True).start()
+            return {'StatusCode': 202, 'Payload': io.BytesIO(b'')}
+
+        result = handler(event, None)
+        return {'StatusCode': 200, 'Payload': io.BytesIO(json.dumps(result).encode('utf-8'))}
+
+
+class LocalTodoistAPI:
+    """Stand-in for todoist_api_python's TodoistAPI with fixed per-call latency"""
+
+    latency_ms = 0.0
+    project_names = ['Inbox', 'Groceries', 'Work', 'Personal']
+
+    def __init__(self, token: str, *args: Any, **kwargs: Any):
+        self.token = token
+
+    def __enter__(self) -> 'LocalTodoistAPI':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def _call(self, **fields: Any) -> SimpleNamespace:
+        time.sleep(self.latency_ms / 1000)
+        fields.setdefault('id', uuid.uuid4().hex[:16])
+        return SimpleNamespace(**fields)
+
+    def _pages(self, count: int = 3, **fields: Any) -> Iterator[List[SimpleNamespace]]:
+        time.sleep(self.latency_ms / 1000)
+        yield [SimpleNamespace(id=uuid.uuid4().hex[:16], **fields) for _ in range(count)]
+
+    # Tasks
+    def add_task(self, content: str, **kwargs: Any) -> SimpleNamespace:
+        return self._call(content=content, **kwargs)
+
+    def update_task(self, task_id: str, **kwargs: Any) -> SimpleNamespace:
+        return self._call(id=task_id, content=kwargs.pop('content', 'task'), **kwargs)
+
+    def complete_task(self, task_id: str) -> bool:
+        self._call()
+        return True
+
+    def get_task(self, task_id: str) -> SimpleNamespace:
+        return self._call(id=task_id, content='task')
+
+    def get_tasks(self, **kwargs: Any) -> Iterator[List[SimpleNamespace]]:
+        return self._pages(content='task', **kwargs)
+
+    def filter_tasks(self, query: str) -> Iterator[List[SimpleNamespace]]:
+        return self._pages(content='task')
+
+    # Projects
+    def add_project(self, name: str, **kwargs: Any) -> SimpleNamespace:
+        return self._call(name=name, **kwargs)
+
+    def update_project(self, project_id: str, **kwargs: Any) -> SimpleNamespace:
+        return self._call(id=project_id, name=kwargs.pop('name', 'project'), **kwargs)
+
+    def get_project(self, project_id: str) -> SimpleNamespace:
+        return self._call(id=project_id, name='project')
+
+    def get_projects(self) -> Iterator[List[SimpleNamespace]]:
+        time.sleep(self.latency_ms / 1000)
+        yield [SimpleNamespace(id=uuid.uuid4().hex[:16], name=name) for name in self.project_names]
+
+    def delete_project(self, project_id: str) -> bool:
+        self._call()
+        return True
+
+    # Labels
+    def add_label(self, name: str) -> SimpleNamespace:
+        return self._call(name=name)
+
+    def update_label(self, label_id: str, **kwargs: Any) -> SimpleNamespace:
+        return self._call(id=label_id, name=kwargs.pop('name', 'label'), **kwargs)
+
+    def get_label(self, label_id: str) -> SimpleNamespace:
+        return self._call(id=label_id, name='label')
+
+    def get_labels(self) -> Iterator[List[SimpleNamespace]]:
+        return self._pages(name='label')
+
+    def delete_label(self, label_id: str) -> bool:
+        self._call()
+        return True
+
+
+def load_handler(name: str, args: argparse.Namespace) -> ModuleType:
+    """
+    Import a handler module from source and swap its clients for local stand-ins
+
+    Args:
+        name: Key of HANDLER_SOURCES
+        args: Parsed command line arguments
+
+    Returns:
+        Loaded handler module
+    """
+    # Clients are created at import time; make sure that works without AWS config
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    os.environ.setdefault('BEDROCK_AGENT_ID', 'local-agent')
+    os.environ.setdefault('BEDROCK_AGENT_ALIAS_ID', 'local-alias')
+    os.environ.setdefault('TODOIST_SECRET_NAME', 'local-secret')
+    os.environ.setdefault('TODOIST_TENANT_SECRET_NAME_TEMPLATE', 'local-secret/{tenant_id}')
+    os.environ.setdefault('AWS_LAMBDA_FUNCTION_NAME', 'local-user-request-handler')
+    os.environ.setdefault('JOB_STORE', 'memory')
+    os.environ['TENANT_RATE_LIMIT_PER_MINUTE'] = str(args.tenant_rate_limit)
+    # Replays must not re-capture themselves
+    os.environ.pop('TRAFFIC_CAPTURE_FILE', None)
+
+    # Lambda puts the package root on sys.path; sibling modules and the bundled
+    # common_libs package are imported from there
+    for package_dir in (COMMON_LIBS_PARENT, os.path.dirname(HANDLER_SOURCES[name])):
+        if package_dir not in sys.path:
+            sys.path.insert(0, package_dir)
+
+    spec = importlib.util.spec_from_file_location(f'replay_{name}', HANDLER_SOURCES[name])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    if name == 'user_request_handler':
+        module.bedrock_agent = LocalBedrockAgentRuntime(args.bedrock_latency_ms)
+        functions = {os.environ['AWS_LAMBDA_FUNCTION_NAME']: module}
+        if args.fast_path:
+            module.TODOIST_TOOL_FUNCTION_NAME = 'local-todoist-tool'
+            functions['local-todoist-tool'] = load_handler('todoist_tool_handler', args)
+        module.lambda_client = LocalLambdaClient(functions)
+    else:
+        LocalTodoistAPI.latency_ms = args.todoist_latency_ms
+        module.secrets_client = LocalSecretsManager()
+        module.TodoistAPI = LocalTodoistAPI
+
+    return module
+
+
+def _is_job_poll(record: Dict[str, Any]) -> bool:
+    """Captured GET /jobs/{jobId} polls refer to jobs that do not exist in a replay"""
+    event = record.get('event', {})
+    return record.get('handler') == 'user_request_handler' and event.get('httpMethod') == 'GET'
+
+
+def load_records(path: str, handler: Optional[str]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Read capture records, optionally keeping only one handler's traffic
+
+    Job status polls are skipped; replayed async submissions create their own jobs.
+
+    Args:
+        path: NDJSON capture file
+        handler: Handler name filter, or None for all
+
+    Returns:
+        Tuple of (capture records, number of skipped job polls)
+    """
+    records = []
+    skipped = 0
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if handler and record.get('handler') != handler:
+                continue
+            if _is_job_poll(record):
+                skipped += 1
+                continue
+            records.append(record)
+    return records, skipped
+
+
+def _to_invocation_event(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild a handler event from a sanitized capture record"""
+    event = dict(record['event'])
+    if record.get('handler') == 'user_request_handler' and not isinstance(event.get('body'), (str, type(None))):
+        event['body'] = json.dumps(event['body'])
+    return event
+
+
+def _status_code(response: Dict[str, Any]) -> int:
+    """Extract the HTTP status from an API Gateway or Bedrock action group response"""
+    if 'statusCode' in response:
+        return int(response['statusCode'])
+    return int(response.get('response', {}).get('httpStatusCode', 0))
+
+
+def run_replay(
+    modules: Dict[str, ModuleType],
+    records: List[Dict[str, Any]],
+    concurrency: int,
+    rate: float,
+    repeat: int
+) -> Tuple[List[Tuple[str, float, int]], float]:
+    """
+    Drive the handlers with captured events at the given concurrency and rate
+
+    Args:
+        modules: Loaded handler modules keyed by name
+        records: Capture records to replay
+        concurrency: Number of worker threads
+        rate: Target requests per second (0 for as fast as possible)
+        repeat: Number of passes over the records
+
+    Returns:
+        Tuple of ([(handler, latency_ms, status_code)], wall time in seconds)
+    """
+    results = []
+    lock = threading.Lock()
+
+    def invoke(record: Dict[str, Any]) -> None:
+        handler = record['handler']
+        event = _to_invocation_event(record)
+        start = time.perf_counter()
+        try:
+            status = _status_code(modules[handler].lambda_handler(event, None))
+        except Exception:
+            status = -1
+        latency_ms = (time.perf_counter() - start) * 1000
+        with lock:
+            results.append((handler, latency_ms, status))
+
+    schedule = records * repeat
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for i, record in enumerate(schedule):
+            # Open-loop pacing: request i is released at i / rate seconds
+            if rate > 0:
+                delay = started + i / rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            pool.submit(invoke, record)
+    elapsed = time.perf_counter() - started
+
+    return results, elapsed
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize(results: List[Tuple[str, float, int]], elapsed: float) -> Dict[str, Any]:
+    """
+    Build throughput, latency and error statistics per handler
+
+    Args:
+        results: Output of run_replay
+        elapsed: Wall time of the replay in seconds
+
+    Returns:
+        Report dict
+    """
+    report = {
+        'total_requests': len(results),
+        'wall_time_s': round(elapsed, 3),
+        'throughput_rps': round(len(results) / elapsed, 2) if elapsed else 0.0,
+        'handlers': {}
+    }
+
+    for handler in sorted({r[0] for r in results}):
+        latencies = sorted(r[1] for r in results if r[0] == handler)
+        statuses = [r[2] for r in results if r[0] == handler]
+        errors = sum(1 for s in statuses if s < 200 or s >= 400)
+
+        histogram = {}
+        for bound in HISTOGRAM_BUCKETS_MS:
+            histogram[f'<={bound}ms'] = 0
+        histogram[f'>{HISTOGRAM_BUCKETS_MS[-1]}ms'] = 0
+        for latency in latencies:
+            for bound in HISTOGRAM_BUCKETS_MS:
+                if latency <= bound:
+                    histogram[f'<={bound}ms'] += 1
+                    break
+            else:
+                histogram[f'>{HISTOGRAM_BUCKETS_MS[-1]}ms'] += 1
+
+        status_counts = {}
+        for status in statuses:
+            key = 'exception' if status == -1 else str(status)
+            status_counts[key] = status_counts.get(key, 0) + 1
+
+        report['handlers'][handler] = {
+            'requests': len(latencies),
+            'error_rate': round(errors / len(latencies), 4),
+            'status_codes': status_counts,
+            'latency_ms': {
+                'min': round(latencies[0], 3),
+                'p50': round(_percentile(latencies, 50), 3),
+                'p90': round(_percentile(latencies, 90), 3),
+                'p99': round(_percentile(latencies, 99), 3),
+                'max': round(latencies[-1], 3),
+                'mean': round(sum(latencies) / len(latencies), 3)
+            },
+            'histogram': histogram
+        }
+
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print a human readable version of the report"""
+    print(f"Requests:   {report['total_requests']}")
+    print(f"Wall time:  {report['wall_time_s']}s")
+    print(f"Throughput: {report['throughput_rps']} req/s")
+    for handler, stats in report['handlers'].items():
+        latency = stats['latency_ms']
+        print(f"\n{handler}")
+        print(f"  requests:   {stats['requests']}")
+        print(f"  error rate: {stats['error_rate'] * 100:.2f}%  {stats['status_codes']}")
+        print(
+            f"  latency:    p50={latency['p50']}ms p90={latency['p90']}ms "
+            f"p99={latency['p99']}ms max={latency['max']}ms"
+        )
+        peak = max(stats['histogram'].values()) or 1
+        for bucket, count in stats['histogram'].items():
+            bar = '#' * int(40 * count / peak)
+            print(f"  {bucket:>10} {count:>7} {bar}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Replay captured Aurora traffic against local handlers')
+    parser.add_argument('capture_file', help='NDJSON file written via TRAFFIC_CAPTURE_FILE')
+    parser.add_argument('--handler', choices=sorted(HANDLER_SOURCES), help='Only replay this handler\'s records')
+    parser.add_argument('--concurrency', type=int, default=4, help='Worker threads (default: 4)')
+    parser.add_argument('--rate', type=float, default=0, help='Target requests/second, 0 = unbounded (default: 0)')
+    parser.add_argument('--repeat', type=int, default=1, help='Passes over the capture file (default: 1)')
+    parser.add_argument('--bedrock-latency-ms', type=float, default=1500, help='Simulated agent stream time (default: 1500)')
+    parser.add_argument('--todoist-latency-ms', type=float, default=150, help='Simulated Todoist call time (default: 150)')
+    parser.add_argument('--tenant-rate-limit', type=int, default=0, help='Per-tenant requests/minute in the Todoist tool, 0 = off (default: 0)')
+    parser.add_argument('--fast-path', action='store_true', help='Route simple commands through the in-process Todoist tool')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    records, skipped = load_records(args.capture_file, args.handler)
+    if skipped:
+        print(f'Skipped {skipped} job status polls', file=sys.stderr)
+    if not records:
+        print('No records to replay', file=sys.stderr)
+        return 1
+
+    modules = {name: load_handler(name, args) for name in sorted({r['handler'] for r in records})}
+    # Handlers print debug output per request; keep it out of the report
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        results, elapsed = run_replay(modules, records, args.concurrency, args.rate, args.repeat)
+    report = summarize(results, elapsed)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,62 @@
 import json
 import boto3
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, date
 from typing import Dict, Any, List, Optional
 from todoist_api_python.api import TodoistAPI
 
+from common_libs.profiling import profile_invocation
+from common_libs.traffic_capture import capture_traffic, pseudonymize
+
 # Initialize AWS clients
 secrets_client = boto3.client("secretsmanager")
 
 # Configuration
 SECRET_NAME = os.environ.get("TODOIST_SECRET_NAME")
 
+# Multi-tenant configuration: requests carrying a tenant ID in their session
+# attributes use that tenant's secret; others use TODOIST_SECRET_NAME
+TENANT_ATTRIBUTE = os.environ.get("TENANT_ATTRIBUTE", "tenantId")
+TENANT_SECRET_NAME_TEMPLATE = os.environ.get(
+    "TODOIST_TENANT_SECRET_NAME_TEMPLATE"
+)  # e.g. "aurora/dev/todoist/{tenant_id}"
+TENANT_POOL_MAX_SIZE = int(os.environ.get("TENANT_POOL_MAX_SIZE", "32"))
+TENANT_TOKEN_TTL_SECONDS = int(os.environ.get("TENANT_TOKEN_TTL_SECONDS", "900"))
+TENANT_RATE_LIMIT_PER_MINUTE = int(os.environ.get("TENANT_RATE_LIMIT_PER_MINUTE", "60"))
+TENANT_RATE_LIMIT_BURST = int(os.environ.get("TENANT_RATE_LIMIT_BURST", "10"))
+# Buckets outlive client eviction; only buckets idle the longest are dropped
+TENANT_RATE_LIMIT_MAX_TENANTS = int(
+    os.environ.get("TENANT_RATE_LIMIT_MAX_TENANTS", "1024")
+)
+METRICS_NAMESPACE = os.environ.get("METRICS_NAMESPACE", "Aurora/TodoistTool")
+
+DEFAULT_TENANT = "default"
+TENANT_ID_PATTERN = re.compile(r"[A-Za-z0-9_\-]{1,64}")
+
+# Trusted tenants may ask for profiling with the "profile" session attribute;
+# sampling and output are configured in common_libs.profiling
+PROFILE_TRUSTED_TENANTS = {
+    t.strip()
+    for t in os.environ.get("PROFILE_TRUSTED_TENANTS", "").split(",")
+    if t.strip()
+}
+
+# Top-level Bedrock action group event keys worth replaying
+CAPTURED_EVENT_KEYS = (
+    "messageVersion",
+    "actionGroup",
+    "apiPath",
+    "httpMethod",
+    "parameters",
+    "requestBody",
+    "sessionAttributes",
+    "promptSessionAttributes",
+)
+
 
 class TodoistJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles datetime objects and removes null values."""
@@ -34,16 +80,209 @@ class TodoistJSONEncoder(json.JSONEncoder):
         return super().encode(cleaned_obj)
 
 
-def get_api_token() -> str:
+def sanitize_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an action group event to its replayable parts for traffic capture."""
+    captured_event = {k: event[k] for k in CAPTURED_EVENT_KEYS if k in event}
+
+    # Same pseudonym the user request handler records for this tenant
+    attributes = dict(captured_event.get("sessionAttributes") or {})
+    tenant_id = attributes.get(TENANT_ATTRIBUTE)
+    if tenant_id:
+        attributes[TENANT_ATTRIBUTE] = pseudonymize(tenant_id)
+        captured_event["sessionAttributes"] = attributes
+
+    return captured_event
+
+
+def profile_requested(event: Dict[str, Any]) -> bool:
+    """Check whether a trusted tenant asked for this invocation to be profiled."""
+    if not PROFILE_TRUSTED_TENANTS:
+        return False
+    attributes = event.get("sessionAttributes") or {}
+    tenant_id = attributes.get(TENANT_ATTRIBUTE) or DEFAULT_TENANT
+    return (
+        str(attributes.get("profile", "")).lower() == "true"
+        and tenant_id in PROFILE_TRUSTED_TENANTS
+    )
+
+
+def get_api_token(secret_name: Optional[str] = None) -> str:
     """Retrieve Todoist API token from AWS Secrets Manager."""
     try:
-        response = secrets_client.get_secret_value(SecretId=SECRET_NAME)
+        response = secrets_client.get_secret_value(SecretId=secret_name or SECRET_NAME)
         secret = json.loads(response["SecretString"])
         return secret.get("api_token", secret.get("token"))
     except Exception as e:
         raise Exception(f"Failed to retrieve API token: {str(e)}")
 
 
+class RateLimitExceeded(Exception):
+    """Raised when a tenant has used up its request budget."""
+
+
+class TokenBucket:
+    """Token bucket limiting how fast a single tenant can call Todoist."""
+
+    def __init__(self, rate_per_second: float, capacity: int):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def try_acquire(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate_per_second
+        )
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class TenantClientPool:
+    """Size-bounded LRU of per-tenant API tokens and live TodoistAPI sessions.
+
+    Entries are keyed strictly by tenant ID, so a client is never shared across
+    tenants. Tokens are re-read after TENANT_TOKEN_TTL_SECONDS to pick up rotation.
+    Rate limit buckets live in a separate, larger LRU so that evicting or
+    refreshing a client does not reset the tenant's budget.
+    """
+
+    def __init__(self, max_size: int, token_ttl_seconds: int, max_buckets: int = 1024):
+        self.max_size = max_size
+        self.token_ttl_seconds = token_ttl_seconds
+        self.max_buckets = max(max_buckets, max_size)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def acquire(self, tenant_id: str) -> Dict[str, Any]:
+        """Return the tenant's client, creating it on a miss.
+
+        Raises RateLimitExceeded if the tenant is over its budget; a limit of
+        0 requests per minute disables rate limiting. The single-user default
+        tenant is never limited, as before multi-tenancy.
+        """
+        limited = TENANT_RATE_LIMIT_PER_MINUTE > 0 and tenant_id != DEFAULT_TENANT
+        with self._lock:
+            if limited and not self._take_token(tenant_id):
+                raise RateLimitExceeded(f"Rate limit exceeded for tenant '{tenant_id}'")
+
+            entry = self._entries.get(tenant_id)
+            if entry and time.monotonic() - entry["created"] > self.token_ttl_seconds:
+                self._close(self._entries.pop(tenant_id))
+                entry = None
+
+            if entry:
+                self._entries.move_to_end(tenant_id)
+                return {"api": entry["api"], "cache_hit": True, "evicted": 0}
+
+        # Fetch the secret outside the lock so one slow tenant does not block others
+        token = get_api_token(secret_name_for_tenant(tenant_id))
+        api = TodoistAPI(token)
+
+        evicted = 0
+        with self._lock:
+            if tenant_id in self._entries:
+                # A concurrent miss already filled the slot; keep that client
+                self._close({"api": api})
+                self._entries.move_to_end(tenant_id)
+                return {
+                    "api": self._entries[tenant_id]["api"],
+                    "cache_hit": True,
+                    "evicted": 0,
+                }
+
+            self._entries[tenant_id] = {"api": api, "created": time.monotonic()}
+            self._entries.move_to_end(tenant_id)
+            while len(self._entries) > self.max_size:
+                _, oldest = self._entries.popitem(last=False)
+                self._close(oldest)
+                evicted += 1
+
+        return {"api": api, "cache_hit": False, "evicted": evicted}
+
+    def _take_token(self, tenant_id: str) -> bool:
+        """Spend one of the tenant's tokens; the caller must hold the lock."""
+        bucket = self._buckets.get(tenant_id)
+        if bucket:
+            self._buckets.move_to_end(tenant_id)
+        else:
+            bucket = TokenBucket(
+                TENANT_RATE_LIMIT_PER_MINUTE / 60, TENANT_RATE_LIMIT_BURST
+            )
+            self._buckets[tenant_id] = bucket
+            # The least recently used bucket has had the longest to refill, so
+            # dropping it is the least likely to hand out extra burst
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        return bucket.try_acquire()
+
+    @staticmethod
+    def _close(entry: Dict[str, Any]) -> None:
+        # TodoistAPI closes its HTTP session when used as a context manager
+        try:
+            entry["api"].__exit__(None, None, None)
+        except Exception as e:
+            print(f"Failed to close Todoist client: {str(e)}")
+
+
+def get_tenant_id(event: Dict[str, Any]) -> str:
+    """Extract and validate the tenant ID from the Bedrock session attributes."""
+    tenant_id = (event.get("sessionAttributes") or {}).get(TENANT_ATTRIBUTE)
+    if not tenant_id:
+        return DEFAULT_TENANT
+    if not TENANT_SECRET_NAME_TEMPLATE:
+        raise ValueError("Multi-tenant requests are not enabled")
+    if tenant_id == DEFAULT_TENANT or not TENANT_ID_PATTERN.fullmatch(tenant_id):
+        raise ValueError("Invalid tenant ID")
+    return tenant_id
+
+
+def secret_name_for_tenant(tenant_id: str) -> str:
+    """Map a tenant ID to its Secrets Manager secret name."""
+    if tenant_id == DEFAULT_TENANT:
+        return SECRET_NAME
+    return TENANT_SECRET_NAME_TEMPLATE.format(tenant_id=tenant_id)
+
+
+def emit_usage_metrics(tenant_id: str, usage: Dict[str, float]) -> None:
+    """Print per-tenant usage as a CloudWatch Embedded Metric Format record."""
+    units = {"DurationMs": "Milliseconds"}
+    print(
+        json.dumps(
+            {
+                "_aws": {
+                    "Timestamp": int(time.time() * 1000),
+                    "CloudWatchMetrics": [
+                        {
+                            "Namespace": METRICS_NAMESPACE,
+                            "Dimensions": [["TenantId"]],
+                            "Metrics": [
+                                {"Name": name, "Unit": units.get(name, "Count")}
+                                for name in usage
+                            ],
+                        }
+                    ],
+                },
+                "TenantId": tenant_id,
+                **usage,
+            }
+        )
+    )
+
+
+# Initialized outside the handler so warm invocations reuse tokens and sessions
+client_pool = TenantClientPool(
+    TENANT_POOL_MAX_SIZE, TENANT_TOKEN_TTL_SECONDS, TENANT_RATE_LIMIT_MAX_TENANTS
+)
+
+
 def parse_labels(labels_str: Optional[str]) -> Optional[List[str]]:
     """Parse comma-separated labels string into a list."""
     if not labels_str:
@@ -72,6 +311,16 @@ def convert_to_dict(obj) -> Dict[str, Any]:
         return obj
 
 
+def resolve_project_id(api: TodoistAPI, project_name: str) -> str:
+    """Find a project's ID by case-insensitive name."""
+    wanted = project_name.strip().casefold()
+    for projects_page in api.get_projects():
+        for project in projects_page:
+            if project.name.casefold() == wanted:
+                return project.id
+    raise ValueError(f"Project '{project_name}' not found")
+
+
 # Task handlers
 def handle_create_task(api: TodoistAPI, params: Dict[str, str]) -> Dict[str, Any]:
     """Handle task creation."""
@@ -86,6 +335,8 @@ def handle_create_task(api: TodoistAPI, params: Dict[str, str]) -> Dict[str, Any
         task_params["description"] = params["description"]
     if "project_id" in params:
         task_params["project_id"] = params["project_id"]
+    elif "project_name" in params:
+        task_params["project_id"] = resolve_project_id(api, params["project_name"])
     if "priority" in params:
         try:
             priority = int(params["priority"])
@@ -356,12 +607,53 @@ def handle_delete_label(api: TodoistAPI, params: Dict[str, str]) -> Dict[str, An
     }
 
 
+def error_response(
+    event: Dict[str, Any], status_code: int, error: str, message: str
+) -> Dict[str, Any]:
+    """Build a Bedrock action group error response."""
+    return {
+        "messageVersion": "1.0",
+        "response": {
+            "actionGroup": event.get("actionGroup", ""),
+            "apiPath": event.get("apiPath", ""),
+            "httpMethod": event.get("httpMethod", "POST"),
+            "httpStatusCode": status_code,
+            "responseBody": {
+                "application/json": {
+                    "body": json.dumps(
+                        {
+                            "success": False,
+                            "error": error,
+                            "message": message,
+                        },
+                        cls=TodoistJSONEncoder,
+                    )
+                }
+            },
+        },
+    }
+
+
+@capture_traffic(
+    "todoist_tool_handler", sanitize_event, json_encoder=TodoistJSONEncoder
+)
+@profile_invocation("todoist-tool-handler", profile_requested)
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Handle Bedrock Agent requests for Todoist operations.
 
     Routes to appropriate handler based on apiPath and operation parameter.
     """
+    start = time.perf_counter()
+    tenant_id = DEFAULT_TENANT
+    usage = {
+        "Requests": 1,
+        "Throttled": 0,
+        "Errors": 0,
+        "ClientCacheHit": 0,
+        "PoolEvictions": 0,
+    }
+
     try:
         # Parse Bedrock event
         action_group = event.get("actionGroup", "")
@@ -382,55 +674,58 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if not operation:
             raise ValueError("Operation parameter is required")
 
-        # Get API token and initialize client
-        api_token = get_api_token()
+        # Get this tenant's client from the warm pool
+        tenant_id = get_tenant_id(event)
+        pooled = client_pool.acquire(tenant_id)
+        api = pooled["api"]
+        usage["ClientCacheHit"] = int(pooled["cache_hit"])
+        usage["PoolEvictions"] = pooled["evicted"]
 
         # Route to appropriate handler based on apiPath and operation
-        with TodoistAPI(api_token) as api:
-            if api_path == "/tasks/manage":
-                if operation == "create":
-                    response_data = handle_create_task(api, parameters)
-                elif operation == "update":
-                    response_data = handle_update_task(api, parameters)
-                elif operation == "complete":
-                    response_data = handle_complete_task(api, parameters)
-                elif operation == "get":
-                    response_data = handle_get_task(api, parameters)
-                elif operation == "list":
-                    response_data = handle_list_tasks(api, parameters)
-                else:
-                    raise ValueError(f"Unsupported task operation: {operation}")
-
-            elif api_path == "/projects/manage":
-                if operation == "create":
-                    response_data = handle_create_project(api, parameters)
-                elif operation == "update":
-                    response_data = handle_update_project(api, parameters)
-                elif operation == "get":
-                    response_data = handle_get_project(api, parameters)
-                elif operation == "list":
-                    response_data = handle_list_projects(api, parameters)
-                elif operation == "delete":
-                    response_data = handle_delete_project(api, parameters)
-                else:
-                    raise ValueError(f"Unsupported project operation: {operation}")
-
-            elif api_path == "/labels/manage":
-                if operation == "create":
-                    response_data = handle_create_label(api, parameters)
-                elif operation == "update":
-                    response_data = handle_update_label(api, parameters)
-                elif operation == "get":
-                    response_data = handle_get_label(api, parameters)
-                elif operation == "list":
-                    response_data = handle_list_labels(api, parameters)
-                elif operation == "delete":
-                    response_data = handle_delete_label(api, parameters)
-                else:
-                    raise ValueError(f"Unsupported label operation: {operation}")
-
+        if api_path == "/tasks/manage":
+            if operation == "create":
+                response_data = handle_create_task(api, parameters)
+            elif operation == "update":
+                response_data = handle_update_task(api, parameters)
+            elif operation == "complete":
+                response_data = handle_complete_task(api, parameters)
+            elif operation == "get":
+                response_data = handle_get_task(api, parameters)
+            elif operation == "list":
+                response_data = handle_list_tasks(api, parameters)
+            else:
+                raise ValueError(f"Unsupported task operation: {operation}")
+
+        elif api_path == "/projects/manage":
+            if operation == "create":
+                response_data = handle_create_project(api, parameters)
+            elif operation == "update":
+                response_data = handle_update_project(api, parameters)
+            elif operation == "get":
+                response_data = handle_get_project(api, parameters)
+            elif operation == "list":
+                response_data = handle_list_projects(api, parameters)
+            elif operation == "delete":
+                response_data = handle_delete_project(api, parameters)
+            else:
+                raise ValueError(f"Unsupported project operation: {operation}")
+
+        elif api_path == "/labels/manage":
+            if operation == "create":
+                response_data = handle_create_label(api, parameters)
+            elif operation == "update":
+                response_data = handle_update_label(api, parameters)
+            elif operation == "get":
+                response_data = handle_get_label(api, parameters)
+            elif operation == "list":
+                response_data = handle_list_labels(api, parameters)
+            elif operation == "delete":
+                response_data = handle_delete_label(api, parameters)
             else:
-                raise ValueError(f"Unsupported API path: {api_path}")
+                raise ValueError(f"Unsupported label operation: {operation}")
+
+        else:
+            raise ValueError(f"Unsupported API path: {api_path}")
 
         # Wrap response data
         final_response = {
@@ -456,51 +751,22 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             },
         }
 
+    except RateLimitExceeded as e:
+        usage["Throttled"] = 1
+        return error_response(event, 429, "Too Many Requests", str(e))
+
     except ValueError as e:
         # Handle validation errors
-        return {
-            "messageVersion": "1.0",
-            "response": {
-                "actionGroup": event.get("actionGroup", ""),
-                "apiPath": event.get("apiPath", ""),
-                "httpMethod": event.get("httpMethod", "POST"),
-                "httpStatusCode": 400,
-                "responseBody": {
-                    "application/json": {
-                        "body": json.dumps(
-                            {
-                                "success": False,
-                                "error": "Bad Request",
-                                "message": str(e),
-                            },
-                            cls=TodoistJSONEncoder,
-                        )
-                    }
-                },
-            },
-        }
+        usage["Errors"] = 1
+        return error_response(event, 400, "Bad Request", str(e))
 
     except Exception as e:
         # Handle all other errors
+        usage["Errors"] = 1
         print(f"Error processing request: {str(e)}")
-        return {
-            "messageVersion": "1.0",
-            "response": {
-                "actionGroup": event.get("actionGroup", ""),
-                "apiPath": event.get("apiPath", ""),
-                "httpMethod": event.get("httpMethod", "POST"),
-                "httpStatusCode": 500,
-                "responseBody": {
-                    "application/json": {
-                        "body": json.dumps(
-                            {
-                                "success": False,
-                                "error": "Internal Server Error",
-                                "message": "Operation failed",
-                            },
-                            cls=TodoistJSONEncoder,
-                        )
-                    }
-                },
-            },
-        }
+        return error_response(event, 500, "Internal Server Error", "Operation failed")
+
+    finally:
+        usage["DurationMs"] = round((time.perf_counter() - start) * 1000, 3)
+        usage["PoolSize"] = len(client_pool)
+        emit_usage_metrics(tenant_id, usage)
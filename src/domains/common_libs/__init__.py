@@ -0,0 +1,4 @@
+"""
+Aurora Assistant - Common Libraries
+Utilities shared by Lambda handlers across domains; bundled into each deployment package
+"""
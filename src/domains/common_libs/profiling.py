@@ -0,0 +1,172 @@
+"""
+Aurora Assistant - Per-Invocation Profiling
+Opt-in cProfile/tracemalloc wrapper shared by the Lambda handlers
+"""
+
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import time
+import tracemalloc
+import uuid
+from functools import wraps
+from typing import Any, Callable, Dict, List
+
+# Handlers configure logging differently; profiles are always reported at INFO
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Profile every invocation, or a random fraction of them
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', '').lower() == 'true'
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_TOP_N = int(os.environ.get('PROFILE_TOP_N', '15'))
+# .prof and summary .json artifacts go here (e.g. /tmp/profiles); empty logs the summary only
+PROFILE_OUTPUT_DIR = os.environ.get('PROFILE_OUTPUT_DIR', '')
+# Only the newest artifacts are kept so a warm container cannot fill /tmp
+PROFILE_MAX_ARTIFACTS = int(os.environ.get('PROFILE_MAX_ARTIFACTS', '20'))
+
+
+def _cpu_hotspots(profiler: cProfile.Profile, top_n: int) -> List[Dict[str, Any]]:
+    """
+    Summarize the most expensive functions by cumulative time
+
+    Args:
+        profiler: Stopped profiler
+        top_n: Number of entries to keep
+
+    Returns:
+        List of hotspot dicts
+    """
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    hotspots = []
+    for (filename, lineno, name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        hotspots.append({
+            'function': f"{os.path.basename(filename)}:{lineno}({name})",
+            'calls': ncalls,
+            'tottime_ms': round(tottime * 1000, 3),
+            'cumtime_ms': round(cumtime * 1000, 3)
+        })
+    hotspots.sort(key=lambda h: h['cumtime_ms'], reverse=True)
+    return hotspots[:top_n]
+
+
+def _memory_hotspots(snapshot: tracemalloc.Snapshot, top_n: int) -> List[Dict[str, Any]]:
+    """
+    Summarize the source lines holding the most memory allocated during the invocation
+
+    Args:
+        snapshot: tracemalloc snapshot taken at the end of the invocation
+        top_n: Number of entries to keep
+
+    Returns:
+        List of hotspot dicts
+    """
+    return [
+        {
+            'location': f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+            'size_kb': round(stat.size / 1024, 1),
+            'count': stat.count
+        }
+        for stat in snapshot.statistics('lineno')[:top_n]
+    ]
+
+
+def _rotate_artifacts(directory: str, component: str, keep: int) -> None:
+    """
+    Delete all but the newest profiles written by this component
+
+    Args:
+        directory: Artifact directory
+        component: Artifact file name prefix
+        keep: Number of .prof/.json pairs to keep
+    """
+    profiles = [
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.startswith(f"{component}-") and name.endswith('.prof')
+    ]
+    profiles.sort(key=os.path.getmtime, reverse=True)
+    for path in profiles[keep:]:
+        for artifact in (path, f"{os.path.splitext(path)[0]}.json"):
+            try:
+                os.remove(artifact)
+            except FileNotFoundError:
+                # A concurrent invocation already rotated it
+                pass
+
+
+def profile_invocation(component: str, is_requested: Callable[[Dict[str, Any]], bool]) -> Callable:
+    """
+    Build a decorator that profiles sampled or explicitly requested invocations
+
+    Disabled invocations only pay for the sampling check and is_requested.
+
+    Args:
+        component: Name used in artifact file names and log records
+        is_requested: Returns True if the event asks for profiling from a trusted caller
+
+    Returns:
+        Handler decorator
+    """
+    def decorator(handler: Callable) -> Callable:
+        @wraps(handler)
+        def wrapper(event: Dict[str, Any], context: Any) -> Any:
+            enabled = (
+                PROFILING_ENABLED
+                or (PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE)
+                or is_requested(event)
+            )
+            if not enabled:
+                return handler(event, context)
+
+            # Leave tracemalloc alone if something else already started it
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                return handler(event, context)
+            finally:
+                profiler.disable()
+                duration_ms = (time.perf_counter() - start) * 1000
+
+                # Reporting must never change the handler's outcome
+                try:
+                    snapshot = tracemalloc.take_snapshot()
+                    _, peak = tracemalloc.get_traced_memory()
+                    request_id = context.aws_request_id if context else str(uuid.uuid4())
+                    summary = {
+                        'component': component,
+                        'request_id': request_id,
+                        'duration_ms': round(duration_ms, 3),
+                        'peak_memory_kb': round(peak / 1024, 1),
+                        'cpu_hotspots': _cpu_hotspots(profiler, PROFILE_TOP_N),
+                        'memory_hotspots': _memory_hotspots(snapshot, PROFILE_TOP_N)
+                    }
+
+                    if PROFILE_OUTPUT_DIR:
+                        os.makedirs(PROFILE_OUTPUT_DIR, exist_ok=True)
+                        base_path = os.path.join(PROFILE_OUTPUT_DIR, f"{component}-{request_id}")
+                        profiler.dump_stats(f"{base_path}.prof")
+                        with open(f"{base_path}.json", 'w', encoding='utf-8') as f:
+                            json.dump(summary, f)
+                        summary['artifact'] = f"{base_path}.prof"
+                        _rotate_artifacts(PROFILE_OUTPUT_DIR, component, PROFILE_MAX_ARTIFACTS)
+
+                    logger.info(f"Invocation profile: {json.dumps(summary)}")
+                except Exception as e:
+                    logger.warning(f"Failed to write invocation profile: {str(e)}")
+                finally:
+                    if started_tracing:
+                        tracemalloc.stop()
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,149 @@
+"""
+Aurora Assistant - Traffic Capture
+Opt-in recording of sanitized event/response pairs for the replay load generator
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Type
+
+# Handlers configure logging differently; capture failures are always reported
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# A file path (e.g. /tmp/capture.ndjson) or 'stdout'
+TRAFFIC_CAPTURE_FILE = os.environ.get('TRAFFIC_CAPTURE_FILE')
+# A full capture file is rotated to <file>.1, so /tmp holds at most twice this much
+TRAFFIC_CAPTURE_MAX_BYTES = int(os.environ.get('TRAFFIC_CAPTURE_MAX_BYTES', str(50 * 1024 * 1024)))
+
+# Keys whose values never leave the handler when capturing traffic
+SENSITIVE_KEY_PATTERN = re.compile(
+    r'token|secret|password|authorization|cookie|api[_-]?key|credential',
+    re.IGNORECASE
+)
+
+_write_lock = threading.Lock()
+
+
+def redact(value: Any) -> Any:
+    """
+    Recursively replace values stored under sensitive keys
+
+    Bedrock action group parameters are lists of {'name': ..., 'value': ...} pairs,
+    so a pair is redacted when its name is sensitive.
+
+    Args:
+        value: Any JSON-compatible value
+
+    Returns:
+        Copy of value with sensitive entries redacted
+    """
+    if isinstance(value, dict):
+        if 'value' in value and SENSITIVE_KEY_PATTERN.search(str(value.get('name', ''))):
+            return {**redact({k: v for k, v in value.items() if k != 'value'}), 'value': '[REDACTED]'}
+        return {
+            k: '[REDACTED]' if SENSITIVE_KEY_PATTERN.search(str(k)) else redact(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(v) for v in value]
+    return value
+
+
+def pseudonymize(value: str) -> str:
+    """
+    Replace an identifier with a stable, non-reversible stand-in
+
+    Args:
+        value: Identifier such as a tenant ID
+
+    Returns:
+        Pseudonym that is the same for every capture of the same value
+    """
+    return 'tenant-' + hashlib.sha256(value.encode('utf-8')).hexdigest()[:12]
+
+
+def write_capture_record(record: Dict[str, Any], json_encoder: Optional[Type[json.JSONEncoder]] = None) -> None:
+    """
+    Append one capture record as an NDJSON line, rotating the file when it is full
+
+    Args:
+        record: Capture record
+        json_encoder: Encoder for values json cannot serialize; defaults to str()
+    """
+    if json_encoder:
+        line = json.dumps(record, cls=json_encoder)
+    else:
+        line = json.dumps(record, default=str)
+
+    if TRAFFIC_CAPTURE_FILE == 'stdout':
+        print(line)
+        return
+
+    data = line + '\n'
+    with _write_lock:
+        try:
+            size = os.path.getsize(TRAFFIC_CAPTURE_FILE)
+        except FileNotFoundError:
+            size = 0
+        if size and size + len(data.encode('utf-8')) > TRAFFIC_CAPTURE_MAX_BYTES:
+            os.replace(TRAFFIC_CAPTURE_FILE, f"{TRAFFIC_CAPTURE_FILE}.1")
+        with open(TRAFFIC_CAPTURE_FILE, 'a', encoding='utf-8') as f:
+            f.write(data)
+
+
+def capture_traffic(
+    handler_name: str,
+    sanitize_event: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+    sanitize_response: Callable[[Any], Any] = lambda response: response,
+    json_encoder: Optional[Type[json.JSONEncoder]] = None
+) -> Callable:
+    """
+    Build a decorator that records sanitized event/response pairs when TRAFFIC_CAPTURE_FILE is set
+
+    Both sides are redacted after the handler-specific sanitizers run. Capture failures
+    are logged and never affect the response.
+
+    Args:
+        handler_name: Recorded as 'handler' so the replay knows which handler to load
+        sanitize_event: Reduces an event to its replayable parts; None skips the capture
+        sanitize_response: Reduces a response to its replayable parts
+        json_encoder: Encoder for values json cannot serialize
+
+    Returns:
+        Handler decorator
+    """
+    def decorator(handler: Callable) -> Callable:
+        @wraps(handler)
+        def wrapper(event: Dict[str, Any], context: Any) -> Any:
+            if not TRAFFIC_CAPTURE_FILE:
+                return handler(event, context)
+
+            start = time.perf_counter()
+            response = handler(event, context)
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            try:
+                captured_event = sanitize_event(event)
+                if captured_event is not None:
+                    write_capture_record({
+                        'handler': handler_name,
+                        'timestamp': time.time(),
+                        'duration_ms': round(duration_ms, 3),
+                        'event': redact(captured_event),
+                        'response': redact(sanitize_response(response))
+                    }, json_encoder)
+            except Exception as e:
+                logger.warning(f"Traffic capture failed: {str(e)}")
+
+            return response
+
+        return wrapper
+
+    return decorator
@@ -4,13 +4,21 @@ Handles API Gateway requests to invoke Bedrock Agent
 """
 
 import json
+import math
 import os
+import re
+import time
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional, Tuple
 import boto3
 from botocore.exceptions import ClientError
 import logging
 
+from fast_path import FastPathIntent, match_intent
+from job_store import JOB_FAILED, JOB_SUCCEEDED, TERMINAL_STATES, create_job_store, lease_expired
+from common_libs.profiling import profile_invocation
+from common_libs.traffic_capture import capture_traffic, pseudonymize
+
 # Configure structured logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -19,8 +27,51 @@ logger.setLevel(logging.INFO)
 AGENT_ID = os.environ.get('BEDROCK_AGENT_ID')
 AGENT_ALIAS_ID = os.environ.get('BEDROCK_AGENT_ALIAS_ID')
 
-# Initialize Bedrock client (outside handler for connection reuse)
+# Fast path: simple commands go straight to the Todoist tool Lambda when it is configured
+TODOIST_TOOL_FUNCTION_NAME = os.environ.get('TODOIST_TOOL_FUNCTION_NAME')
+FAST_PATH_CONFIDENCE_THRESHOLD = float(os.environ.get('FAST_PATH_CONFIDENCE_THRESHOLD', '0.9'))
+
+# Session attribute carrying the caller's tenant ID to the Todoist tool
+TENANT_ATTRIBUTE = os.environ.get('TENANT_ATTRIBUTE', 'tenantId')
+
+# Client session/memory IDs are prefixed with a tenant namespace (at most 20 chars)
+# and must stay within Bedrock's 100 character limit
+_CLIENT_ID_PATTERN = re.compile(r'[0-9a-zA-Z._:-]{2,80}')
+ANONYMOUS_NAMESPACE = 'anonymous'
+
+# Async mode: long-polls must return before API Gateway's ~29s integration timeout
+ASYNC_MAX_WAIT_SECONDS = float(os.environ.get('ASYNC_MAX_WAIT_SECONDS', '25'))
+ASYNC_POLL_INTERVAL_SECONDS = float(os.environ.get('ASYNC_POLL_INTERVAL_SECONDS', '0.5'))
+JOB_PROGRESS_INTERVAL_SECONDS = float(os.environ.get('JOB_PROGRESS_INTERVAL_SECONDS', '1'))
+# Function with the long timeout that runs background jobs; defaults to this function
+JOB_WORKER_FUNCTION_NAME = os.environ.get('JOB_WORKER_FUNCTION_NAME')
+# Lease taken by a worker when there is no Lambda context to read the remaining time from
+JOB_LEASE_SECONDS = float(os.environ.get('JOB_LEASE_SECONDS', '300'))
+
+# Authenticated principals allowed to request profiling with the X-Aurora-Profile header
+PROFILE_TRUSTED_PRINCIPALS = {
+    p.strip() for p in os.environ.get('PROFILE_TRUSTED_PRINCIPALS', '').split(',') if p.strip()
+}
+
+# Initialize AWS clients (outside handler for connection reuse)
 bedrock_agent = boto3.client('bedrock-agent-runtime')
+lambda_client = boto3.client('lambda')
+
+# None when async mode is not configured
+job_store = create_job_store()
+
+# What each fast-path intent was trying to do, for failure messages
+_FAST_PATH_ACTIONS = {
+    'complete_task': 'complete task {task_id}',
+    'create_task': 'create the task "{content}"',
+    'create_task_in_project': 'add "{content}" to {project_name}'
+}
+
+# Requests using any of these need the agent itself, never the fast path
+_AGENT_ONLY_PARAMS = (
+    'agentId', 'agentAliasId', 'enableTrace', 'endSession', 'memoryId', 'sessionState',
+    'bedrockModelConfigurations', 'streamingConfigurations'
+)
 
 
 class BedrockAgentError(Exception):
@@ -28,6 +79,79 @@ class BedrockAgentError(Exception):
     pass
 
 
+# Top-level API Gateway event keys worth replaying; identity and headers are dropped
+_CAPTURED_EVENT_KEYS = ('resource', 'path', 'httpMethod', 'queryStringParameters', 'pathParameters', 'body')
+
+
+def _sanitize_event(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Reduce an API Gateway event to its replayable parts (redacted by capture_traffic)
+    
+    Args:
+        event: API Gateway event
+        
+    Returns:
+        Sanitized event dict, or None for events that should not be captured
+    """
+    # Background job invocations are internal and not replayable on their own
+    if 'asyncJob' in event:
+        return None
+        
+    sanitized = {k: event[k] for k in _CAPTURED_EVENT_KEYS if k in event}
+    
+    # Keep only a stable pseudonym of the authorizer tenant, so multi-tenant and
+    # job ownership behaviour can be replayed without real identities or claims
+    tenant_id = _resolve_tenant_id(event)
+    if tenant_id:
+        sanitized['requestContext'] = {'authorizer': {TENANT_ATTRIBUTE: pseudonymize(tenant_id)}}
+    
+    # Parse the body so sensitive keys inside it can be redacted too
+    if isinstance(sanitized.get('body'), str):
+        try:
+            sanitized['body'] = json.loads(sanitized['body'])
+        except json.JSONDecodeError:
+            pass
+            
+    return sanitized
+
+
+def _sanitize_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop response headers and parse the body for capture
+    
+    Args:
+        response: API Gateway proxy response
+        
+    Returns:
+        Sanitized response dict
+    """
+    captured_response = dict(response)
+    captured_response.pop('headers', None)
+    try:
+        captured_response['body'] = json.loads(captured_response.get('body', ''))
+    except (TypeError, json.JSONDecodeError):
+        pass
+    return captured_response
+
+
+def _profile_requested(event: Dict[str, Any]) -> bool:
+    """
+    Check whether a trusted caller asked for this invocation to be profiled
+    
+    Args:
+        event: API Gateway event
+        
+    Returns:
+        True if the X-Aurora-Profile header is set by a trusted principal
+    """
+    if not PROFILE_TRUSTED_PRINCIPALS:
+        return False
+        
+    headers = event.get('headers') or {}
+    flag = next((v for k, v in headers.items() if k.lower() == 'x-aurora-profile'), '')
+    return str(flag).lower() in ('1', 'true') and _resolve_tenant_id(event) in PROFILE_TRUSTED_PRINCIPALS
+
+
 def _validate_request_body(body: Dict[str, Any]) -> Dict[str, str]:
     """
     Validate required parameters in request body
@@ -51,15 +175,55 @@ def _validate_request_body(body: Dict[str, Any]) -> Dict[str, str]:
     if not agent_id:
         errors['agentId'] = 'agentId must be provided in request or BEDROCK_AGENT_ID environment variable'
         
+    for key in ('sessionId', 'memoryId'):
+        if key in body and not (isinstance(body[key], str) and _CLIENT_ID_PATTERN.fullmatch(body[key])):
+            errors[key] = f"{key} must be 2-80 characters of letters, digits, '.', '_', ':' or '-'"
+            
     return errors
 
 
-def _build_invoke_params(body: Dict[str, Any]) -> Dict[str, Any]:
+def _resolve_tenant_id(event: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the caller's tenant ID from the API Gateway authorizer context
+    
+    The request body is never trusted for this, so one caller cannot act as another tenant.
+    
+    Args:
+        event: API Gateway event
+        
+    Returns:
+        Tenant ID, or None for unauthenticated (single-tenant) requests
+    """
+    authorizer = (event.get('requestContext') or {}).get('authorizer') or {}
+    claims = authorizer.get('claims') or {}
+    return authorizer.get(TENANT_ATTRIBUTE) or claims.get('sub') or authorizer.get('principalId')
+
+
+def _scope_to_tenant(client_id: str, tenant_id: Optional[str]) -> str:
+    """
+    Prefix a client-chosen session or memory ID with the caller's tenant namespace
+    
+    Bedrock keeps session attributes and memory per ID, so without the prefix a
+    caller could resume another tenant's session by reusing its ID.
+    
+    Args:
+        client_id: sessionId or memoryId from the request
+        tenant_id: Authenticated tenant ID, if any
+        
+    Returns:
+        ID to send to Bedrock
+    """
+    namespace = pseudonymize(tenant_id) if tenant_id else ANONYMOUS_NAMESPACE
+    return f"{namespace}:{client_id}"
+
+
+def _build_invoke_params(body: Dict[str, Any], tenant_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Build parameters for bedrock agent invocation
     
     Args:
         body: Validated request body
+        tenant_id: Authenticated tenant ID, if any
         
     Returns:
         Dict of parameters for invoke_agent call
@@ -72,7 +236,7 @@ def _build_invoke_params(body: Dict[str, Any]) -> Dict[str, Any]:
     invoke_params = {
         'agentId': agent_id,
         'agentAliasId': agent_alias_id,
-        'sessionId': session_id,
+        'sessionId': _scope_to_tenant(session_id, tenant_id),
         'inputText': body['inputText']
     }
     
@@ -86,16 +250,154 @@ def _build_invoke_params(body: Dict[str, Any]) -> Dict[str, Any]:
         if param in body:
             invoke_params[param] = body[param]
             
+    if 'memoryId' in invoke_params:
+        invoke_params['memoryId'] = _scope_to_tenant(invoke_params['memoryId'], tenant_id)
+        
+    # Always overwrite the tenant attribute: Bedrock persists session attributes,
+    # so omitting it would keep whatever an earlier turn stored
+    session_state = dict(invoke_params.get('sessionState') or {})
+    session_attributes = dict(session_state.get('sessionAttributes') or {})
+    session_attributes[TENANT_ATTRIBUTE] = tenant_id or ''
+    session_state['sessionAttributes'] = session_attributes
+    invoke_params['sessionState'] = session_state
+        
     return invoke_params
 
 
-def _process_agent_response(response: Dict[str, Any], enable_trace: bool = False) -> Dict[str, Any]:
+def _match_fast_path(body: Dict[str, Any]) -> Optional[FastPathIntent]:
+    """
+    Decide whether a request can bypass the Bedrock Agent
+    
+    Args:
+        body: Validated request body
+        
+    Returns:
+        Matched intent, or None if the request must go to the agent
+    """
+    if not TODOIST_TOOL_FUNCTION_NAME or body.get('fastPath') is False:
+        return None
+        
+    if any(param in body for param in _AGENT_ONLY_PARAMS):
+        return None
+        
+    return match_intent(body['inputText'], FAST_PATH_CONFIDENCE_THRESHOLD)
+
+
+def _invoke_fast_path(
+    intent: FastPathIntent,
+    session_id: str,
+    request_id: str,
+    tenant_id: Optional[str] = None
+) -> Optional[Tuple[int, Dict[str, Any]]]:
+    """
+    Run a matched intent directly through the Todoist tool Lambda
+    
+    Args:
+        intent: Matched fast-path intent
+        session_id: Session ID returned to the caller
+        request_id: Request ID for logging
+        tenant_id: Authenticated tenant ID, if any
+        
+    Returns:
+        Tuple of (status code, response body), or None if the request should fall back to the agent
+    """
+    parameters = {'operation': intent.operation, **intent.parameters}
+    
+    # Same event shape Bedrock sends to the action group Lambda
+    payload = {
+        'messageVersion': '1.0',
+        'actionGroup': 'fast_path',
+        'apiPath': intent.api_path,
+        'httpMethod': 'POST',
+        'sessionId': session_id,
+        'parameters': [{'name': k, 'type': 'string', 'value': v} for k, v in parameters.items()],
+        'sessionAttributes': {TENANT_ATTRIBUTE: tenant_id} if tenant_id else {}
+    }
+    
+    try:
+        response = lambda_client.invoke(
+            FunctionName=TODOIST_TOOL_FUNCTION_NAME,
+            InvocationType='RequestResponse',
+            Payload=json.dumps(payload)
+        )
+    except ClientError as e:
+        # Nothing ran, so the agent can safely take over
+        logger.warning(f"Fast path invocation failed, falling back to agent: {str(e)}", extra={
+            'request_id': request_id
+        })
+        return None
+        
+    try:
+        tool_response = json.loads(response['Payload'].read())['response']
+        status_code = tool_response['httpStatusCode']
+        tool_body = json.loads(tool_response['responseBody']['application/json']['body'])
+    except (KeyError, TypeError, json.JSONDecodeError):
+        status_code, tool_body = 500, {}
+        
+    if 'FunctionError' in response:
+        status_code = 500
+        
+    if status_code == 400:
+        # Rejected before touching Todoist (e.g. unknown project); let the agent clarify
+        logger.info("Fast path rejected by tool, falling back to agent", extra={
+            'request_id': request_id,
+            'intent': intent.name,
+            'tool_message': tool_body.get('message')
+        })
+        return None
+        
+    if status_code == 429:
+        # The tool's per-tenant limiter rejected the call before it ran; the agent would hit the same limit
+        logger.warning("Fast path rate limited by tool", extra={
+            'request_id': request_id,
+            'intent': intent.name
+        })
+        return 429, {'error': 'Rate limit exceeded', 'message': tool_body.get('message')}
+        
+    # Agent-shaped result so clients need not care which path served them
+    result = {
+        'completion': tool_body.get('message', ''),
+        'citations': [],
+        'sessionId': session_id,
+        'fastPath': {'intent': intent.name, 'confidence': intent.confidence}
+    }
+    
+    if status_code != 200:
+        # The operation may have partially run; retrying through the agent could duplicate it,
+        # so explain the failure the way the agent would instead
+        logger.error("Fast path operation failed", extra={
+            'request_id': request_id,
+            'intent': intent.name,
+            'status_code': status_code
+        })
+        action = _FAST_PATH_ACTIONS.get(intent.name, 'do that').format(**intent.parameters)
+        reason = tool_body.get('message') or 'the Todoist tool returned an error'
+        result['completion'] = f"Sorry, I couldn't {action}: {reason}."
+        result['fastPath']['error'] = {'statusCode': status_code, 'message': tool_body.get('message')}
+        return 200, result
+        
+    logger.info("Request served by fast path", extra={
+        'request_id': request_id,
+        'session_id': session_id,
+        'intent': intent.name,
+        'confidence': intent.confidence
+    })
+    
+    return 200, result
+
+
+def _process_agent_response(
+    response: Dict[str, Any],
+    enable_trace: bool = False,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
     """
     Process streaming response from Bedrock Agent
     
     Args:
         response: Response from invoke_agent call
         enable_trace: Whether to include trace information
+        on_progress: Called with the partial completion after each stream event
         
     Returns:
         Processed response dict
@@ -106,6 +408,7 @@ def _process_agent_response(response: Dict[str, Any], enable_trace: bool = False
     completion = ""
     citations = []
     traces = []
+    chunks = 0
     
     try:
         for event in response.get('completion', []):
@@ -115,6 +418,7 @@ def _process_agent_response(response: Dict[str, Any], enable_trace: bool = False
                 # Extract text content
                 if 'bytes' in chunk:
                     completion += chunk['bytes'].decode('utf-8')
+                    chunks += 1
                     
                 # Extract citations
                 if 'attribution' in chunk and 'citations' in chunk['attribution']:
@@ -130,6 +434,9 @@ def _process_agent_response(response: Dict[str, Any], enable_trace: bool = False
                     'returnControl': event['returnControl']
                 }
                 
+            if on_progress:
+                on_progress({'partialCompletion': completion, 'chunks': chunks})
+                
     except Exception as e:
         logger.error(f"Error processing agent response: {str(e)}")
         raise BedrockAgentError(f"Failed to process agent response: {str(e)}")
@@ -161,19 +468,267 @@ def _create_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
         'headers': {
             'Content-Type': 'application/json',
             'Access-Control-Allow-Origin': '*',  # Configure as needed
-            'Access-Control-Allow-Methods': 'POST, OPTIONS',
-            'Access-Control-Allow-Headers': 'Content-Type'
+            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+            'Access-Control-Allow-Headers': 'Content-Type, X-Aurora-Profile'
         },
         'body': json.dumps(body, default=str)  # Handle datetime serialization
     }
 
 
+def _execute_request(
+    body: Dict[str, Any],
+    tenant_id: Optional[str],
+    request_id: str,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Tuple[int, Dict[str, Any]]:
+    """
+    Run a validated request through the fast path or the Bedrock Agent
+    
+    Shared by synchronous requests and background jobs.
+    
+    Args:
+        body: Validated request body
+        tenant_id: Authenticated tenant ID, if any
+        request_id: Request ID for logging
+        on_progress: Optional callback for incremental agent output
+        
+    Returns:
+        Tuple of (status code, response body)
+        
+    Raises:
+        BedrockAgentError: If the agent response cannot be processed
+    """
+    # Serve simple commands without agent orchestration when confident enough
+    body.setdefault('sessionId', str(uuid.uuid4()))
+    intent = _match_fast_path(body)
+    if intent:
+        fast_path_result = _invoke_fast_path(intent, body['sessionId'], request_id, tenant_id)
+        if fast_path_result:
+            return fast_path_result
+            
+    # Build invocation parameters
+    invoke_params = _build_invoke_params(body, tenant_id)
+    # Callers only ever see their own, unprefixed session ID
+    session_id = body['sessionId']
+    
+    logger.info("Invoking Bedrock Agent", extra={
+        'request_id': request_id,
+        'session_id': session_id,
+        'agent_id': invoke_params['agentId']
+    })
+    
+    # Invoke Bedrock Agent
+    try:
+        response = bedrock_agent.invoke_agent(**invoke_params)
+    except ClientError as e:
+        error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+        error_message = e.response.get('Error', {}).get('Message', str(e))
+        
+        logger.error("Bedrock Agent invocation failed", extra={
+            'request_id': request_id,
+            'error_code': error_code,
+            'error_message': error_message
+        })
+        
+        return 502, {
+            'error': 'Agent invocation failed',
+            'details': f"{error_code}: {error_message}"
+        }
+    
+    # Process response
+    enable_trace = body.get('enableTrace', False)
+    result = _process_agent_response(response, enable_trace, on_progress)
+    
+    # Add session ID to result
+    result['sessionId'] = session_id
+    
+    logger.info("Request processed successfully", extra={
+        'request_id': request_id,
+        'session_id': session_id,
+        'completion_length': len(result.get('completion', '')),
+        'citations_count': len(result.get('citations', []))
+    })
+    
+    return 200, result
+
+
+def _submit_job(body: Dict[str, Any], tenant_id: Optional[str], request_id: str, context: Any) -> Dict[str, Any]:
+    """
+    Store a new job and hand it to a background invocation of the job worker
+    
+    Args:
+        body: Validated request body
+        tenant_id: Authenticated tenant ID, if any
+        request_id: Request ID for logging
+        context: Lambda context
+        
+    Returns:
+        API Gateway response (202 with the job ID)
+    """
+    if job_store is None:
+        return _create_response(400, {'error': 'Async mode is not enabled'})
+        
+    job_id = str(uuid.uuid4())
+    body.setdefault('sessionId', str(uuid.uuid4()))
+    job_store.create(job_id, {'sessionId': body['sessionId'], 'tenantId': tenant_id})
+    
+    function_name = (
+        JOB_WORKER_FUNCTION_NAME
+        or (context.invoked_function_arn if context else os.environ.get('AWS_LAMBDA_FUNCTION_NAME'))
+    )
+    try:
+        lambda_client.invoke(
+            FunctionName=function_name,
+            InvocationType='Event',
+            Payload=json.dumps({'asyncJob': {'jobId': job_id, 'body': body, 'tenantId': tenant_id}})
+        )
+    except ClientError as e:
+        logger.error(f"Failed to start background job: {str(e)}", extra={
+            'request_id': request_id,
+            'job_id': job_id
+        })
+        job_store.update(job_id, status=JOB_FAILED, statusCode=502, error='Failed to start job')
+        return _create_response(502, {'error': 'Failed to start job', 'jobId': job_id})
+        
+    logger.info("Async job submitted", extra={
+        'request_id': request_id,
+        'job_id': job_id,
+        'session_id': body['sessionId']
+    })
+    
+    return _create_response(202, {
+        'jobId': job_id,
+        'status': 'queued',
+        'sessionId': body['sessionId'],
+        'statusUrl': f"/jobs/{job_id}"
+    })
+
+
+def _run_job(job: Dict[str, Any], request_id: str, context: Any) -> Dict[str, Any]:
+    """
+    Execute a queued job in the background invocation, recording progress and the result
+    
+    Errors are recorded on the job rather than raised, so Lambda does not retry the
+    invocation and run the agent twice.
+    
+    Args:
+        job: The 'asyncJob' payload from _submit_job
+        request_id: Request ID for logging
+        context: Lambda context
+        
+    Returns:
+        Summary of the job outcome
+    """
+    job_id = job['jobId']
+    
+    # The lease ends when this invocation is killed; pollers report the job failed after that
+    lease_seconds = context.get_remaining_time_in_millis() / 1000 if context else JOB_LEASE_SECONDS
+    if not job_store.claim(job_id, lease_seconds):
+        logger.warning("Job already claimed or expired, skipping delivery", extra={
+            'request_id': request_id,
+            'job_id': job_id
+        })
+        return {'jobId': job_id, 'status': 'skipped'}
+        
+    last_write = 0.0
+    
+    def on_progress(progress: Dict[str, Any]) -> None:
+        nonlocal last_write
+        now = time.monotonic()
+        if now - last_write >= JOB_PROGRESS_INTERVAL_SECONDS:
+            job_store.update(job_id, progress=progress)
+            last_write = now
+            
+    try:
+        status_code, result = _execute_request(job['body'], job.get('tenantId'), request_id, on_progress)
+        status = JOB_SUCCEEDED if status_code == 200 else JOB_FAILED
+        job_store.update(job_id, status=status, statusCode=status_code, result=result)
+        
+    except Exception as e:
+        logger.error(f"Background job failed: {str(e)}", extra={
+            'request_id': request_id,
+            'job_id': job_id
+        })
+        status = JOB_FAILED
+        status_code = 502 if isinstance(e, BedrockAgentError) else 500
+        job_store.update(job_id, status=status, statusCode=status_code, error=str(e))
+        
+    return {'jobId': job_id, 'status': status}
+
+
+def _get_job_status(event: Dict[str, Any], context: Any, request_id: str) -> Dict[str, Any]:
+    """
+    Return a job's state, optionally long-polling until it changes
+    
+    Query parameters:
+        wait: Seconds to wait for a change (capped at ASYNC_MAX_WAIT_SECONDS)
+        since: Version the client already has; returns as soon as the job is newer
+        
+    Args:
+        event: API Gateway event for GET /jobs/{jobId}
+        context: Lambda context
+        request_id: Request ID for logging
+        
+    Returns:
+        API Gateway response
+    """
+    if job_store is None:
+        return _create_response(400, {'error': 'Async mode is not enabled'})
+        
+    job_id = (event.get('pathParameters') or {}).get('jobId')
+    query = event.get('queryStringParameters') or {}
+    try:
+        wait = float(query.get('wait', 0))
+        since = int(query.get('since', 0))
+    except ValueError:
+        return _create_response(400, {'error': 'wait and since must be numbers'})
+    # nan compares false against both bounds, so it must be rejected before clamping
+    if not math.isfinite(wait):
+        return _create_response(400, {'error': 'wait must be a finite number'})
+    wait = min(max(wait, 0.0), ASYNC_MAX_WAIT_SECONDS)
+        
+    # Leave a second to build the response before the function times out
+    if context:
+        wait = min(wait, context.get_remaining_time_in_millis() / 1000 - 1)
+    deadline = time.monotonic() + wait
+    tenant_id = _resolve_tenant_id(event)
+    
+    while True:
+        job = job_store.get(job_id) if job_id else None
+        
+        # Other tenants' jobs are indistinguishable from missing ones
+        if not job or job.get('tenantId') != tenant_id:
+            return _create_response(404, {'error': 'Job not found'})
+            
+        if lease_expired(job):
+            # The worker timed out, crashed or never started; async invokes are not retried
+            job = {**job, 'status': JOB_FAILED, 'statusCode': 504, 'error': 'Job did not complete in time'}
+            
+        if job['status'] in TERMINAL_STATES or job['version'] > since or time.monotonic() >= deadline:
+            break
+            
+        time.sleep(ASYNC_POLL_INTERVAL_SECONDS)
+        
+    logger.info("Job status returned", extra={
+        'request_id': request_id,
+        'job_id': job_id,
+        'status': job['status'],
+        'version': job['version']
+    })
+    
+    public_fields = ('jobId', 'status', 'version', 'sessionId', 'createdAt', 'updatedAt',
+                     'progress', 'statusCode', 'result', 'error')
+    return _create_response(200, {k: job[k] for k in public_fields if k in job})
+
+
+@capture_traffic('user_request_handler', _sanitize_event, _sanitize_response)
+@profile_invocation('user-request-handler', _profile_requested)
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler for Aurora Assistant user requests
     
     Args:
-        event: API Gateway event
+        event: API Gateway event, or an internal background job event
         context: Lambda context
         
     Returns:
@@ -190,7 +745,14 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         }
     )
     
+    # Background invocation started by _submit_job
+    if 'asyncJob' in event:
+        return _run_job(event['asyncJob'], request_id, context)
+        
     try:
+        if event.get('httpMethod') == 'GET':
+            return _get_job_status(event, context, request_id)
+            
         # Parse request body
         if not event.get('body'):
             logger.warning("Missing request body", extra={'request_id': request_id})
@@ -214,49 +776,14 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             })
             return _create_response(400, {'error': 'Validation failed', 'details': validation_errors})
         
-        # Build invocation parameters
-        invoke_params = _build_invoke_params(body)
-        session_id = invoke_params['sessionId']
-        
-        logger.info("Invoking Bedrock Agent", extra={
-            'request_id': request_id,
-            'session_id': session_id,
-            'agent_id': invoke_params['agentId']
-        })
+        tenant_id = _resolve_tenant_id(event)
         
-        # Invoke Bedrock Agent
-        try:
-            response = bedrock_agent.invoke_agent(**invoke_params)
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            error_message = e.response.get('Error', {}).get('Message', str(e))
+        # Async mode: answer immediately and run the agent in the background
+        if body.get('async') is True:
+            return _submit_job(body, tenant_id, request_id, context)
             
-            logger.error("Bedrock Agent invocation failed", extra={
-                'request_id': request_id,
-                'error_code': error_code,
-                'error_message': error_message
-            })
-            
-            return _create_response(502, {
-                'error': 'Agent invocation failed',
-                'details': f"{error_code}: {error_message}"
-            })
-        
-        # Process response
-        enable_trace = body.get('enableTrace', False)
-        result = _process_agent_response(response, enable_trace)
-        
-        # Add session ID to result
-        result['sessionId'] = session_id
-        
-        logger.info("Request processed successfully", extra={
-            'request_id': request_id,
-            'session_id': session_id,
-            'completion_length': len(result.get('completion', '')),
-            'citations_count': len(result.get('citations', []))
-        })
-        
-        return _create_response(200, result)
+        status_code, result = _execute_request(body, tenant_id, request_id)
+        return _create_response(status_code, result)
         
     except BedrockAgentError as e:
         logger.error(f"Bedrock Agent error: {str(e)}", extra={'request_id': request_id})
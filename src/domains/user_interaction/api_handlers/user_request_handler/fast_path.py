@@ -0,0 +1,160 @@
+"""
+Aurora Assistant - Fast-Path Intent Matcher
+Recognizes simple, unambiguous Todoist commands that can skip Bedrock Agent orchestration
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
+
+
+@dataclass
+class FastPathIntent:
+    """A matched command ready to be sent to the Todoist tool"""
+    name: str
+    api_path: str
+    operation: str
+    parameters: Dict[str, str] = field(default_factory=dict)
+    confidence: float = 0.0
+
+
+# (intent name, pattern, api path, operation, base confidence)
+# Patterns must match the whole (normalized) input; anything looser goes to the agent.
+_GRAMMAR: List[Tuple[str, Pattern[str], str, str, float]] = [
+    (
+        'complete_task',
+        re.compile(r'(?:complete|finish|close|check off) task (?:#|id )?(?P<task_id>\d+)', re.IGNORECASE),
+        '/tasks/manage', 'complete', 0.98
+    ),
+    (
+        'complete_task',
+        re.compile(r'mark task (?:#|id )?(?P<task_id>\d+) as (?:done|complete|completed)', re.IGNORECASE),
+        '/tasks/manage', 'complete', 0.98
+    ),
+    (
+        'create_task_in_project',
+        re.compile(
+            # An explicit task marker means " to " belongs to the content, so leave those to create_task
+            r'(?:add|put) (?!(?:a |new )*task\b)(?P<content>.+?) to (?:my |the )?(?P<project_name>[\w][\w\- ]{0,60}?)(?: list| project)?',
+            re.IGNORECASE
+        ),
+        '/tasks/manage', 'create', 0.95
+    ),
+    (
+        'create_task',
+        re.compile(
+            r'(?:add|create) (?:a )?(?:new )?task:? (?P<content>.+)',
+            re.IGNORECASE
+        ),
+        '/tasks/manage', 'create', 0.92
+    ),
+]
+
+# Words that signal scheduling, references to earlier turns or compound requests.
+# The Todoist tool would need the agent to turn these into due_string/task_id/multiple calls.
+_AMBIGUITY_MARKERS = re.compile(
+    r'\b(?:today|tonight|tomorrow|yesterday|monday|tuesday|wednesday|thursday|friday|saturday|sunday|'
+    r'next|every|daily|weekly|monthly|at \d|by \d|in \d+|due|remind|it|this|that|them|those|'
+    r'and|then|also|priority|p[1-4]|label|labels)\b|[,;?!@#]',
+    re.IGNORECASE
+)
+
+# Contents that name a person rather than a task ("add me to the team")
+_OBJECT_PRONOUNS = re.compile(r'(?:me|us|you|him|her|them|myself|ourselves)', re.IGNORECASE)
+
+# Project names are nouns; a leading verb means the split landed inside the task ("call mom")
+_LEADING_VERBS = re.compile(
+    r'(?:call|text|email|ask|tell|meet|visit|buy|get|pick|pay|book|send|go|do|make|write|read|'
+    r'fix|clean|check|finish|review|schedule)\b',
+    re.IGNORECASE
+)
+
+_LEADING_ARTICLE = re.compile(r'(?:a|an|the) ', re.IGNORECASE)
+
+_TRAILING_PUNCTUATION = re.compile(r'[\s.]+$')
+_QUOTES = re.compile(r'^["\'](.+)["\']$')
+
+
+def _clean(value: str) -> str:
+    """Strip whitespace and a single pair of surrounding quotes"""
+    value = value.strip()
+    quoted = _QUOTES.match(value)
+    return quoted.group(1).strip() if quoted else value
+
+
+def _score(base_confidence: float, parameters: Dict[str, str]) -> float:
+    """
+    Lower the grammar's base confidence for inputs that look like they need the agent
+
+    Args:
+        base_confidence: Confidence of the matching grammar rule
+        parameters: Extracted parameters
+
+    Returns:
+        Adjusted confidence between 0 and 1
+    """
+    confidence = base_confidence
+    content = parameters.get('content', '')
+    project_name = parameters.get('project_name')
+
+    # "add a task to call mom" without the project split: "to ..." reads as either, so ask the agent
+    if content.lower().startswith('to '):
+        confidence -= 0.5
+
+    # The content/project split is a guess; only trust it for task-like content and noun-like projects
+    if project_name is not None:
+        if _OBJECT_PRONOUNS.fullmatch(content):
+            confidence -= 0.5
+        if _LEADING_ARTICLE.match(content):
+            confidence -= 0.1
+        if _LEADING_VERBS.match(project_name) or re.search(r'\bto\b', project_name, re.IGNORECASE):
+            confidence -= 0.5
+
+    for key in ('content', 'project_name'):
+        value = parameters.get(key)
+        if value is None:
+            continue
+        if _AMBIGUITY_MARKERS.search(value):
+            confidence -= 0.5
+        if len(value.split()) > 8:
+            confidence -= 0.2
+
+    return max(confidence, 0.0)
+
+
+def match_intent(input_text: str, threshold: float) -> Optional[FastPathIntent]:
+    """
+    Match user input against the fast-path grammar
+
+    Args:
+        input_text: Raw user input
+        threshold: Minimum confidence required to bypass the agent
+
+    Returns:
+        FastPathIntent if a rule matched with enough confidence, otherwise None
+    """
+    text = _TRAILING_PUNCTUATION.sub('', ' '.join(input_text.split()))
+    if not text or len(text) > 200:
+        return None
+
+    for name, pattern, api_path, operation, base_confidence in _GRAMMAR:
+        match = pattern.fullmatch(text)
+        if not match:
+            continue
+
+        parameters = {k: _clean(v) for k, v in match.groupdict().items() if v}
+        confidence = _score(base_confidence, parameters)
+
+        # First matching rule decides; never fall through to a looser rule
+        if confidence < threshold:
+            return None
+
+        return FastPathIntent(
+            name=name,
+            api_path=api_path,
+            operation=operation,
+            parameters=parameters,
+            confidence=confidence
+        )
+
+    return None
@@ -0,0 +1,224 @@
+"""
+Aurora Assistant - Async Job Store
+Persists status, incremental progress and results of background agent requests
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+import boto3
+from botocore.exceptions import ClientError
+
+# Job lifecycle states
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+TERMINAL_STATES = (JOB_SUCCEEDED, JOB_FAILED)
+
+# How long finished jobs stay readable
+JOB_TTL_SECONDS = int(os.environ.get('JOB_TTL_SECONDS', '86400'))
+
+# Queued jobs not claimed within this long are treated as failed. Must cover the async
+# invoke config's maximum event age plus the function timeout.
+JOB_START_TIMEOUT_SECONDS = int(os.environ.get('JOB_START_TIMEOUT_SECONDS', '900'))
+
+
+class JobStore(ABC):
+    """
+    Interface for job persistence
+
+    Every write bumps the job's version so pollers can wait for "anything newer than N".
+    """
+
+    @abstractmethod
+    def create(self, job_id: str, job: Dict[str, Any]) -> None:
+        """Store a new job in the queued state"""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the job, or None if it does not exist"""
+
+    @abstractmethod
+    def claim(self, job_id: str, lease_seconds: float) -> bool:
+        """
+        Move a queued job to running, holding it for at most lease_seconds
+
+        Jobs whose start lease has already expired are not claimed; pollers report them as failed.
+
+        Args:
+            job_id: Job to claim
+            lease_seconds: Time the worker has left before its invocation is killed
+
+        Returns:
+            False if the job was already claimed, so duplicate deliveries do not rerun it
+        """
+
+    @abstractmethod
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Set fields on an existing job and bump its version"""
+
+
+class InMemoryJobStore(JobStore):
+    """Process-local store, used as the stand-in for local runs and replays"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def create(self, job_id: str, job: Dict[str, Any]) -> None:
+        now = int(time.time())
+        with self._lock:
+            self._jobs[job_id] = {
+                **job,
+                'jobId': job_id,
+                'status': JOB_QUEUED,
+                'version': 1,
+                'createdAt': now,
+                'updatedAt': now,
+                'leaseExpiresAt': now + JOB_START_TIMEOUT_SECONDS
+            }
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def claim(self, job_id: str, lease_seconds: float) -> bool:
+        now = int(time.time())
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job['status'] != JOB_QUEUED or lease_expired(job, now):
+                return False
+            job.update(
+                status=JOB_RUNNING,
+                version=job['version'] + 1,
+                updatedAt=now,
+                leaseExpiresAt=now + int(math.ceil(lease_seconds))
+            )
+            return True
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job.update(fields, version=job['version'] + 1, updatedAt=int(time.time()))
+
+
+class DynamoDBJobStore(JobStore):
+    """
+    DynamoDB-backed store
+
+    Nested values (progress, result) are stored as JSON strings to avoid Decimal conversion.
+    """
+
+    _JSON_FIELDS = ('progress', 'result')
+
+    def __init__(self, table_name: str):
+        self._table = boto3.resource('dynamodb').Table(table_name)
+
+    def _encode(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            k: json.dumps(v, default=str) if k in self._JSON_FIELDS else v
+            for k, v in fields.items()
+        }
+
+    def create(self, job_id: str, job: Dict[str, Any]) -> None:
+        now = int(time.time())
+        self._table.put_item(Item=self._encode({
+            **job,
+            'jobId': job_id,
+            'status': JOB_QUEUED,
+            'version': 1,
+            'createdAt': now,
+            'updatedAt': now,
+            'leaseExpiresAt': now + JOB_START_TIMEOUT_SECONDS,
+            'expiresAt': now + JOB_TTL_SECONDS
+        }))
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        item = self._table.get_item(Key={'jobId': job_id}, ConsistentRead=True).get('Item')
+        if not item:
+            return None
+        for key in self._JSON_FIELDS:
+            if key in item:
+                item[key] = json.loads(item[key])
+        # DynamoDB returns numbers as Decimal
+        for key in ('version', 'createdAt', 'updatedAt', 'leaseExpiresAt', 'expiresAt'):
+            if key in item:
+                item[key] = int(item[key])
+        return item
+
+    def claim(self, job_id: str, lease_seconds: float) -> bool:
+        now = int(time.time())
+        try:
+            self._table.update_item(
+                Key={'jobId': job_id},
+                UpdateExpression='SET #status = :running, updatedAt = :now, leaseExpiresAt = :lease '
+                                 'ADD version :one',
+                ConditionExpression='#status = :queued AND leaseExpiresAt >= :now',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={
+                    ':running': JOB_RUNNING,
+                    ':queued': JOB_QUEUED,
+                    ':now': now,
+                    ':lease': now + int(math.ceil(lease_seconds)),
+                    ':one': 1
+                }
+            )
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException':
+                return False
+            raise
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        fields = self._encode({**fields, 'updatedAt': int(time.time())})
+        names = {f'#f{i}': k for i, k in enumerate(fields)}
+        values = {f':v{i}': v for i, v in enumerate(fields.values())}
+        assignments = ', '.join(f'#f{i} = :v{i}' for i in range(len(fields)))
+        self._table.update_item(
+            Key={'jobId': job_id},
+            UpdateExpression=f'SET {assignments} ADD version :one',
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues={**values, ':one': 1}
+        )
+
+
+def lease_expired(job: Dict[str, Any], now: Optional[int] = None) -> bool:
+    """
+    Check whether an unfinished job has outlived its lease
+
+    A running job past its lease was killed by a timeout or crash; a queued one was never
+    delivered. Neither will reach a terminal state on its own.
+
+    Args:
+        job: Job as returned by JobStore.get
+        now: Current epoch seconds, defaults to time.time()
+
+    Returns:
+        True if the job should be reported as failed
+    """
+    if job['status'] in TERMINAL_STATES or 'leaseExpiresAt' not in job:
+        return False
+    return (now if now is not None else int(time.time())) > job['leaseExpiresAt']
+
+
+def create_job_store() -> Optional[JobStore]:
+    """
+    Build the configured job store
+
+    JOB_TABLE_NAME selects DynamoDB; JOB_STORE=memory selects the local stand-in.
+
+    Returns:
+        JobStore, or None when async mode is not configured
+    """
+    table_name = os.environ.get('JOB_TABLE_NAME')
+    if table_name:
+        return DynamoDBJobStore(table_name)
+    if os.environ.get('JOB_STORE') == 'memory':
+        return InMemoryJobStore()
+    return None
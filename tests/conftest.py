@@ -0,0 +1,20 @@
+"""
+Shared pytest setup: make the Lambda handler directories importable the way
+they are laid out inside their deployment packages
+"""
+
+import os
+import sys
+
+SRC_DOMAINS = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'domains'))
+
+for package_dir in (
+    SRC_DOMAINS,  # common_libs is bundled at the package root
+    os.path.join(SRC_DOMAINS, 'user_interaction', 'api_handlers', 'user_request_handler'),
+    os.path.join(SRC_DOMAINS, 'ai_tooling', 'todoist_tool_handler'),
+):
+    if package_dir not in sys.path:
+        sys.path.insert(0, package_dir)
+
+# Handlers create boto3 clients at import time
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
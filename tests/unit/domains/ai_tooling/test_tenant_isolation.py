@@ -0,0 +1,153 @@
+"""Unit tests for the Todoist tool's per-tenant client pool and tenant resolution."""
+
+import pytest
+
+import lambda_function
+
+
+class FakeTodoistAPI:
+    def __init__(self, token):
+        self.token = token
+        self.closed = False
+
+    def __exit__(self, *exc_info):
+        self.closed = True
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(lambda_function.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture
+def secrets(monkeypatch):
+    """Record secret lookups and hand out a token per secret name."""
+    lookups = []
+
+    def get_api_token(secret_name=None):
+        lookups.append(secret_name)
+        return f"token-for-{secret_name}"
+
+    monkeypatch.setattr(lambda_function, "get_api_token", get_api_token)
+    monkeypatch.setattr(lambda_function, "TodoistAPI", FakeTodoistAPI)
+    monkeypatch.setattr(lambda_function, "SECRET_NAME", "default-secret")
+    monkeypatch.setattr(
+        lambda_function, "TENANT_SECRET_NAME_TEMPLATE", "aurora/test/{tenant_id}"
+    )
+    monkeypatch.setattr(lambda_function, "TENANT_RATE_LIMIT_PER_MINUTE", 0)
+    return lookups
+
+
+def test_clients_are_never_shared_across_tenants(secrets, clock):
+    pool = lambda_function.TenantClientPool(max_size=4, token_ttl_seconds=900)
+
+    alice = pool.acquire("alice")
+    bob = pool.acquire("bob")
+    alice_again = pool.acquire("alice")
+
+    assert alice["api"] is not bob["api"]
+    assert alice["api"].token == "token-for-aurora/test/alice"
+    assert bob["api"].token == "token-for-aurora/test/bob"
+    assert alice_again == {"api": alice["api"], "cache_hit": True, "evicted": 0}
+    assert secrets == ["aurora/test/alice", "aurora/test/bob"]
+
+
+def test_least_recently_used_client_is_evicted_and_closed(secrets, clock):
+    pool = lambda_function.TenantClientPool(max_size=2, token_ttl_seconds=900)
+
+    alice = pool.acquire("alice")["api"]
+    bob = pool.acquire("bob")["api"]
+    pool.acquire("alice")
+    carol = pool.acquire("carol")
+
+    assert carol["evicted"] == 1
+    assert bob.closed and not alice.closed
+    assert len(pool) == 2
+    assert pool.acquire("alice")["cache_hit"]
+    assert not pool.acquire("bob")["cache_hit"]
+
+
+def test_token_is_reread_after_ttl(secrets, clock):
+    pool = lambda_function.TenantClientPool(max_size=2, token_ttl_seconds=900)
+
+    first = pool.acquire("alice")["api"]
+    clock.now += 901
+    second = pool.acquire("alice")
+
+    assert not second["cache_hit"]
+    assert second["api"] is not first
+    assert first.closed
+    assert secrets == ["aurora/test/alice", "aurora/test/alice"]
+
+
+def test_rate_limit_survives_client_eviction(secrets, clock, monkeypatch):
+    monkeypatch.setattr(lambda_function, "TENANT_RATE_LIMIT_PER_MINUTE", 60)
+    monkeypatch.setattr(lambda_function, "TENANT_RATE_LIMIT_BURST", 2)
+    pool = lambda_function.TenantClientPool(
+        max_size=1, token_ttl_seconds=900, max_buckets=8
+    )
+
+    pool.acquire("alice")
+    pool.acquire("bob")  # evicts alice's client
+    pool.acquire("alice")  # evicts bob's client
+
+    with pytest.raises(lambda_function.RateLimitExceeded):
+        pool.acquire("alice")
+
+    # One token per second refills
+    clock.now += 1
+    assert pool.acquire("alice")["api"].token == "token-for-aurora/test/alice"
+
+
+def test_default_tenant_is_not_rate_limited(secrets, clock, monkeypatch):
+    monkeypatch.setattr(lambda_function, "TENANT_RATE_LIMIT_PER_MINUTE", 60)
+    monkeypatch.setattr(lambda_function, "TENANT_RATE_LIMIT_BURST", 1)
+    pool = lambda_function.TenantClientPool(max_size=2, token_ttl_seconds=900)
+
+    for _ in range(20):
+        pool.acquire(lambda_function.DEFAULT_TENANT)
+
+    assert secrets == ["default-secret"]
+
+
+def _event(tenant_id=None):
+    if tenant_id is None:
+        return {"sessionAttributes": {}}
+    return {"sessionAttributes": {lambda_function.TENANT_ATTRIBUTE: tenant_id}}
+
+
+def test_missing_tenant_uses_default(secrets):
+    assert lambda_function.get_tenant_id(_event()) == lambda_function.DEFAULT_TENANT
+    assert lambda_function.get_tenant_id(_event("")) == lambda_function.DEFAULT_TENANT
+
+
+def test_tenants_are_rejected_when_multi_tenancy_is_off(secrets, monkeypatch):
+    monkeypatch.setattr(lambda_function, "TENANT_SECRET_NAME_TEMPLATE", None)
+
+    with pytest.raises(ValueError, match="not enabled"):
+        lambda_function.get_tenant_id(_event("alice"))
+
+
+@pytest.mark.parametrize(
+    "tenant_id", ["default", "alice\n", "../other", "a" * 65, "alice/bob", "alice bob"]
+)
+def test_invalid_tenant_ids_are_rejected(secrets, tenant_id):
+    with pytest.raises(ValueError, match="Invalid tenant ID"):
+        lambda_function.get_tenant_id(_event(tenant_id))
+
+
+def test_valid_tenant_maps_to_its_own_secret(secrets):
+    tenant_id = lambda_function.get_tenant_id(_event("alice-01"))
+
+    assert tenant_id == "alice-01"
+    assert lambda_function.secret_name_for_tenant(tenant_id) == "aurora/test/alice-01"
@@ -0,0 +1,45 @@
+"""Unit tests for what the Todoist tool keeps when capturing action group traffic."""
+
+from common_libs import traffic_capture
+
+import lambda_function
+
+
+def test_event_keeps_replayable_keys_and_pseudonymizes_tenant():
+    event = {
+        "messageVersion": "1.0",
+        "agent": {"id": "agent-1"},
+        "inputText": "complete task 5",
+        "sessionId": "session-1",
+        "apiPath": "/tasks/manage",
+        "parameters": [{"name": "task_id", "type": "string", "value": "5"}],
+        "sessionAttributes": {lambda_function.TENANT_ATTRIBUTE: "acme", "locale": "en"},
+    }
+
+    sanitized = lambda_function.sanitize_event(event)
+
+    assert sanitized == {
+        "messageVersion": "1.0",
+        "apiPath": "/tasks/manage",
+        "parameters": [{"name": "task_id", "type": "string", "value": "5"}],
+        "sessionAttributes": {
+            lambda_function.TENANT_ATTRIBUTE: traffic_capture.pseudonymize("acme"),
+            "locale": "en",
+        },
+    }
+    # The live event is untouched
+    assert event["sessionAttributes"][lambda_function.TENANT_ATTRIBUTE] == "acme"
+
+
+def test_sensitive_parameters_are_redacted_once_captured():
+    event = {
+        "parameters": [
+            {"name": "content", "type": "string", "value": "buy milk"},
+            {"name": "api_token", "type": "string", "value": "secret-value"},
+        ]
+    }
+
+    captured = traffic_capture.redact(lambda_function.sanitize_event(event))
+
+    assert captured["parameters"][0]["value"] == "buy milk"
+    assert captured["parameters"][1]["value"] == "[REDACTED]"
@@ -0,0 +1,71 @@
+"""
+Unit tests for the shared per-invocation profiler
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from common_libs import profiling
+
+
+def _handler(event, context):
+    return {'statusCode': 200, 'items': [str(i) for i in range(100)]}
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(profiling, 'PROFILING_ENABLED', True)
+
+
+def test_disabled_profiling_only_checks_the_request(monkeypatch):
+    monkeypatch.setattr(profiling, 'PROFILING_ENABLED', False)
+    monkeypatch.setattr(profiling, 'PROFILE_SAMPLE_RATE', 0)
+    seen = []
+
+    wrapped = profiling.profile_invocation('test', lambda event: seen.append(event) or False)(_handler)
+
+    assert wrapped({'a': 1}, None)['statusCode'] == 200
+    assert seen == [{'a': 1}]
+
+
+def test_summary_only_by_default(enabled, monkeypatch, tmp_path, caplog):
+    monkeypatch.setattr(profiling, 'PROFILE_OUTPUT_DIR', '')
+    wrapped = profiling.profile_invocation('test', lambda event: False)(_handler)
+
+    with caplog.at_level('INFO', logger=profiling.__name__):
+        assert wrapped({}, SimpleNamespace(aws_request_id='req-1'))['statusCode'] == 200
+
+    assert any('Invocation profile' in record.message and 'req-1' in record.message for record in caplog.records)
+    assert not os.listdir(tmp_path)
+
+
+def test_only_newest_artifacts_are_kept(enabled, monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, 'PROFILE_OUTPUT_DIR', str(tmp_path))
+    monkeypatch.setattr(profiling, 'PROFILE_MAX_ARTIFACTS', 2)
+    (tmp_path / 'other-component-req.prof').write_text('')
+    wrapped = profiling.profile_invocation('test', lambda event: False)(_handler)
+
+    for i in range(4):
+        wrapped({}, SimpleNamespace(aws_request_id=f"req-{i}"))
+        # mtime resolution can be coarse; make the write order explicit
+        for suffix in ('prof', 'json'):
+            path = tmp_path / f"test-req-{i}.{suffix}"
+            os.utime(path, (i, i))
+
+    assert sorted(os.listdir(tmp_path)) == [
+        'other-component-req.prof',
+        'test-req-2.json', 'test-req-2.prof',
+        'test-req-3.json', 'test-req-3.prof'
+    ]
+
+
+def test_handler_errors_propagate(enabled, monkeypatch):
+    monkeypatch.setattr(profiling, 'PROFILE_OUTPUT_DIR', '')
+
+    def failing_handler(event, context):
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError, match='boom'):
+        profiling.profile_invocation('test', lambda event: False)(failing_handler)({}, None)
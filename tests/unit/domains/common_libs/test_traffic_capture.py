@@ -0,0 +1,115 @@
+"""
+Unit tests for the shared traffic capture: redaction, pseudonyms and the capture file cap
+"""
+
+import json
+
+import pytest
+
+from common_libs import traffic_capture
+
+
+@pytest.fixture
+def capture_file(monkeypatch, tmp_path):
+    path = tmp_path / 'capture.ndjson'
+    monkeypatch.setattr(traffic_capture, 'TRAFFIC_CAPTURE_FILE', str(path))
+    return path
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_sensitive_keys_are_redacted_at_any_depth():
+    value = {
+        'inputText': 'hi',
+        'Authorization': 'Bearer abc',
+        'nested': [{'api_key': 'k', 'apiKey': 'k', 'keep': 1}, {'sessionToken': 't'}],
+        'credentials': {'user': 'u'}
+    }
+
+    assert traffic_capture.redact(value) == {
+        'inputText': 'hi',
+        'Authorization': '[REDACTED]',
+        'nested': [{'api_key': '[REDACTED]', 'apiKey': '[REDACTED]', 'keep': 1}, {'sessionToken': '[REDACTED]'}],
+        'credentials': '[REDACTED]'
+    }
+
+
+def test_bedrock_parameter_pairs_are_redacted_by_name():
+    parameters = [
+        {'name': 'content', 'type': 'string', 'value': 'buy milk'},
+        {'name': 'api_token', 'type': 'string', 'value': 'secret-value'}
+    ]
+
+    assert traffic_capture.redact({'parameters': parameters}) == {'parameters': [
+        {'name': 'content', 'type': 'string', 'value': 'buy milk'},
+        {'name': 'api_token', 'type': 'string', 'value': '[REDACTED]'}
+    ]}
+
+
+def test_redact_does_not_modify_its_input():
+    value = {'password': 'p', 'items': [{'name': 'secret', 'value': 's'}]}
+
+    traffic_capture.redact(value)
+
+    assert value == {'password': 'p', 'items': [{'name': 'secret', 'value': 's'}]}
+
+
+def test_pseudonyms_are_stable_and_hide_the_identifier():
+    pseudonym = traffic_capture.pseudonymize('alice@example.com')
+
+    assert pseudonym == traffic_capture.pseudonymize('alice@example.com')
+    assert pseudonym != traffic_capture.pseudonymize('bob@example.com')
+    assert pseudonym.startswith('tenant-') and 'alice' not in pseudonym
+
+
+def test_capture_records_redacted_pairs(capture_file):
+    @traffic_capture.capture_traffic('test_handler', lambda event: {'body': event['body']})
+    def handler(event, context):
+        return {'statusCode': 200, 'token': 'response-secret'}
+
+    response = handler({'body': {'password': 'p', 'text': 'hi'}, 'headers': {'Cookie': 'c'}}, None)
+
+    assert response == {'statusCode': 200, 'token': 'response-secret'}
+    [record] = _records(capture_file)
+    assert record['handler'] == 'test_handler'
+    assert record['event'] == {'body': {'password': '[REDACTED]', 'text': 'hi'}}
+    assert record['response'] == {'statusCode': 200, 'token': '[REDACTED]'}
+
+
+def test_events_sanitized_to_none_are_skipped(capture_file):
+    handler = traffic_capture.capture_traffic('test_handler', lambda event: None)(lambda event, context: 'ok')
+
+    assert handler({}, None) == 'ok'
+    assert not capture_file.exists()
+
+
+def test_capture_failures_never_affect_the_response(capture_file):
+    def broken_sanitizer(event):
+        raise ValueError('bad event')
+
+    handler = traffic_capture.capture_traffic('test_handler', broken_sanitizer)(lambda event, context: 'ok')
+
+    assert handler({}, None) == 'ok'
+
+
+def test_disabled_capture_writes_nothing(monkeypatch, tmp_path):
+    monkeypatch.setattr(traffic_capture, 'TRAFFIC_CAPTURE_FILE', None)
+    handler = traffic_capture.capture_traffic('test_handler', lambda event: event)(lambda event, context: 'ok')
+
+    assert handler({'a': 1}, None) == 'ok'
+    assert not list(tmp_path.iterdir())
+
+
+def test_full_capture_file_is_rotated(capture_file, monkeypatch):
+    monkeypatch.setattr(traffic_capture, 'TRAFFIC_CAPTURE_MAX_BYTES', 150)
+    rotated = capture_file.with_name('capture.ndjson.1')
+
+    for i in range(6):
+        traffic_capture.write_capture_record({'i': i, 'padding': 'x' * 30})
+
+    assert capture_file.stat().st_size <= 150
+    assert rotated.stat().st_size <= 150
+    # The newest records are kept; older rotations are dropped
+    assert [r['i'] for r in _records(rotated) + _records(capture_file)] == [2, 3, 4, 5]
@@ -0,0 +1,232 @@
+"""
+Unit tests for async job mode: the job store, the background worker and long-polling
+"""
+
+import json
+import threading
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+
+import app
+from job_store import (
+    JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, InMemoryJobStore, lease_expired
+)
+
+
+class StubLambdaClient:
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+
+    def invoke(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        return {'StatusCode': 202}
+
+
+class StubContext:
+    aws_request_id = 'req-worker'
+    invoked_function_arn = 'arn:aws:lambda:us-east-1:123456789012:function:handler'
+
+    def __init__(self, remaining_ms=300000):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+
+@pytest.fixture
+def store(monkeypatch):
+    job_store = InMemoryJobStore()
+    monkeypatch.setattr(app, 'job_store', job_store)
+    monkeypatch.setattr(app, 'ASYNC_POLL_INTERVAL_SECONDS', 0.01)
+    return job_store
+
+
+def _poll(job_id, tenant_id='acme', **query):
+    event = {
+        'httpMethod': 'GET',
+        'pathParameters': {'jobId': job_id},
+        'queryStringParameters': {k: str(v) for k, v in query.items()} or None,
+        'requestContext': {'authorizer': {app.TENANT_ATTRIBUTE: tenant_id}}
+    }
+    response = app._get_job_status(event, None, 'req-poll')
+    return response['statusCode'], json.loads(response['body'])
+
+
+# Job store
+
+def test_claim_is_idempotent():
+    job_store = InMemoryJobStore()
+    job_store.create('job-1', {'tenantId': 'acme'})
+
+    assert job_store.claim('job-1', 60)
+    assert not job_store.claim('job-1', 60)
+    assert job_store.get('job-1')['status'] == JOB_RUNNING
+    assert not job_store.claim('missing', 60)
+
+
+def test_every_write_bumps_the_version():
+    job_store = InMemoryJobStore()
+    job_store.create('job-1', {'tenantId': 'acme'})
+    job_store.claim('job-1', 60)
+    job_store.update('job-1', progress={'chunks': 1})
+
+    assert job_store.get('job-1')['version'] == 3
+
+
+def test_job_whose_start_lease_expired_is_not_claimed():
+    job_store = InMemoryJobStore()
+    job_store.create('job-1', {'tenantId': 'acme'})
+    job = job_store.get('job-1')
+
+    assert lease_expired(job, job['leaseExpiresAt'] + 1)
+    job_store._jobs['job-1']['leaseExpiresAt'] = int(time.time()) - 1
+    assert not job_store.claim('job-1', 60)
+
+
+def test_finished_jobs_never_expire():
+    job = {'status': JOB_SUCCEEDED, 'leaseExpiresAt': 0}
+
+    assert not lease_expired(job)
+
+
+# Submitting and running jobs
+
+def test_submit_starts_the_worker(store, monkeypatch):
+    worker = StubLambdaClient()
+    monkeypatch.setattr(app, 'lambda_client', worker)
+    monkeypatch.setattr(app, 'JOB_WORKER_FUNCTION_NAME', 'job-worker')
+
+    body = {'inputText': 'plan my week', 'sessionId': 'session-1'}
+    response = app._submit_job(body, 'acme', 'req-1', StubContext())
+    body = json.loads(response['body'])
+
+    assert response['statusCode'] == 202
+    assert body['status'] == JOB_QUEUED
+    assert worker.calls[0]['FunctionName'] == 'job-worker'
+    assert worker.calls[0]['InvocationType'] == 'Event'
+    assert json.loads(worker.calls[0]['Payload'])['asyncJob']['jobId'] == body['jobId']
+    assert store.get(body['jobId'])['tenantId'] == 'acme'
+
+
+def test_submit_marks_job_failed_when_worker_cannot_start(store, monkeypatch):
+    error = ClientError({'Error': {'Code': 'ServiceException', 'Message': 'Unavailable'}}, 'Invoke')
+    monkeypatch.setattr(app, 'lambda_client', StubLambdaClient(error))
+
+    response = app._submit_job({'inputText': 'plan my week'}, 'acme', 'req-1', StubContext())
+    job_id = json.loads(response['body'])['jobId']
+
+    assert response['statusCode'] == 502
+    assert store.get(job_id)['status'] == JOB_FAILED
+
+
+def test_run_job_records_progress_and_result(store, monkeypatch):
+    def execute_request(body, tenant_id, request_id, on_progress):
+        on_progress({'partialCompletion': 'Mon', 'chunks': 1})
+        return 200, {'completion': 'Monday: gym', 'citations': [], 'sessionId': body['sessionId']}
+
+    monkeypatch.setattr(app, '_execute_request', execute_request)
+    store.create('job-1', {'tenantId': 'acme', 'sessionId': 'session-1'})
+    job = {'jobId': 'job-1', 'body': {'inputText': 'plan', 'sessionId': 'session-1'}, 'tenantId': 'acme'}
+
+    assert app._run_job(job, 'req-1', StubContext()) == {'jobId': 'job-1', 'status': JOB_SUCCEEDED}
+    stored = store.get('job-1')
+    assert stored['progress'] == {'partialCompletion': 'Mon', 'chunks': 1}
+    assert stored['result']['completion'] == 'Monday: gym'
+
+    # A duplicate delivery does not run the agent again
+    assert app._run_job(job, 'req-2', StubContext())['status'] == 'skipped'
+
+
+def test_run_job_records_errors_instead_of_raising(store, monkeypatch):
+    def execute_request(body, tenant_id, request_id, on_progress):
+        raise app.BedrockAgentError('stream broke')
+
+    monkeypatch.setattr(app, '_execute_request', execute_request)
+    store.create('job-1', {'tenantId': 'acme'})
+
+    result = app._run_job({'jobId': 'job-1', 'body': {}, 'tenantId': 'acme'}, 'req-1', StubContext())
+
+    assert result['status'] == JOB_FAILED
+    assert store.get('job-1')['statusCode'] == 502
+
+
+def test_claim_lease_follows_remaining_invocation_time(store):
+    store.create('job-1', {'tenantId': 'acme'})
+    store.claim('job-1', StubContext(remaining_ms=120000).get_remaining_time_in_millis() / 1000)
+
+    assert store.get('job-1')['leaseExpiresAt'] - int(time.time()) in (119, 120)
+
+
+# Polling
+
+def test_poll_returns_current_state(store):
+    store.create('job-1', {'tenantId': 'acme', 'sessionId': 'session-1'})
+
+    status_code, body = _poll('job-1')
+
+    assert status_code == 200
+    assert body['status'] == JOB_QUEUED
+    assert body['version'] == 1
+    assert 'tenantId' not in body and 'leaseExpiresAt' not in body
+
+
+def test_other_tenants_jobs_are_not_found(store):
+    store.create('job-1', {'tenantId': 'acme'})
+
+    assert _poll('job-1', tenant_id='globex')[0] == 404
+    assert _poll('missing')[0] == 404
+
+
+def test_long_poll_returns_as_soon_as_job_changes(store):
+    store.create('job-1', {'tenantId': 'acme'})
+    timer = threading.Timer(0.05, store.update, args=('job-1',), kwargs={'status': JOB_SUCCEEDED})
+    timer.start()
+
+    start = time.monotonic()
+    status_code, body = _poll('job-1', wait=5, since=1)
+    timer.join()
+
+    assert status_code == 200
+    assert body['status'] == JOB_SUCCEEDED
+    assert time.monotonic() - start < 2
+
+
+def test_long_poll_times_out_without_changes(store):
+    store.create('job-1', {'tenantId': 'acme'})
+
+    start = time.monotonic()
+    status_code, body = _poll('job-1', wait=0.1, since=1)
+
+    assert status_code == 200
+    assert body['version'] == 1
+    assert time.monotonic() - start >= 0.1
+
+
+def test_expired_lease_is_reported_as_failed(store):
+    store.create('job-1', {'tenantId': 'acme'})
+    store.claim('job-1', 60)
+    store._jobs['job-1']['leaseExpiresAt'] = int(time.time()) - 1
+
+    status_code, body = _poll('job-1', wait=5, since=2)
+
+    assert status_code == 200
+    assert body['status'] == JOB_FAILED
+    assert body['statusCode'] == 504
+
+
+@pytest.mark.parametrize('query', [
+    {'wait': 'nan'},
+    {'wait': 'inf'},
+    {'wait': '-inf'},
+    {'wait': 'soon'},
+    {'since': '1.5'},
+])
+def test_invalid_poll_parameters_are_rejected(store, query):
+    store.create('job-1', {'tenantId': 'acme'})
+
+    assert _poll('job-1', **query)[0] == 400
@@ -0,0 +1,70 @@
+"""
+Unit tests for the user request handler's fast-path intent matcher
+"""
+
+import pytest
+
+from fast_path import match_intent
+
+THRESHOLD = 0.9
+
+
+@pytest.mark.parametrize('text, task_id', [
+    ('complete task 42', '42'),
+    ('Finish task #7.', '7'),
+    ('mark task id 13 as done', '13'),
+])
+def test_complete_task(text, task_id):
+    intent = match_intent(text, THRESHOLD)
+    assert intent is not None
+    assert intent.operation == 'complete'
+    assert intent.parameters == {'task_id': task_id}
+
+
+@pytest.mark.parametrize('text, content', [
+    ('create task: buy milk', 'buy milk'),
+    ('add a new task call the plumber', 'call the plumber'),
+    # An explicit task marker keeps " to " inside the content
+    ('add task: go to the gym', 'go to the gym'),
+    ('add a task: drive to the airport', 'drive to the airport'),
+])
+def test_create_task(text, content):
+    intent = match_intent(text, THRESHOLD)
+    assert intent is not None
+    assert intent.name == 'create_task'
+    assert intent.parameters == {'content': content}
+
+
+@pytest.mark.parametrize('text, content, project_name', [
+    ('add milk to Groceries', 'milk', 'Groceries'),
+    ('add eggs to groceries', 'eggs', 'groceries'),
+    ('add buy milk to groceries', 'buy milk', 'groceries'),
+    ('add buy milk to my Groceries list', 'buy milk', 'Groceries'),
+    ('put call mom to the personal project', 'call mom', 'personal'),
+])
+def test_create_task_in_project(text, content, project_name):
+    intent = match_intent(text, THRESHOLD)
+    assert intent is not None
+    assert intent.name == 'create_task_in_project'
+    assert intent.parameters == {'content': content, 'project_name': project_name}
+
+
+@pytest.mark.parametrize('text', [
+    # Ambiguous splits
+    'add a task to call mom',
+    'add me to the team',
+    'add the report to work',
+    'add go to the gym to personal',
+    # Needs the agent for scheduling, references or multiple operations
+    'add task buy milk tomorrow',
+    'add task: call it in',
+    'complete task 4 and task 5',
+    'what is on my list?',
+    '',
+])
+def test_falls_back_to_agent(text):
+    assert match_intent(text, THRESHOLD) is None
+
+
+def test_threshold_is_respected():
+    assert match_intent('add task: buy milk', 0.99) is None
@@ -0,0 +1,123 @@
+"""
+Unit tests for how the user request handler runs fast-path intents through the Todoist tool
+"""
+
+import io
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+
+import app
+
+
+class StubLambdaClient:
+    """Returns a canned Todoist tool response, or raises the given error"""
+
+    def __init__(self, status_code=200, body=None, error=None):
+        self.status_code = status_code
+        self.body = body or {}
+        self.error = error
+        self.calls = []
+
+    def invoke(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        payload = {
+            'messageVersion': '1.0',
+            'response': {
+                'httpStatusCode': self.status_code,
+                'responseBody': {'application/json': {'body': json.dumps(self.body)}}
+            }
+        }
+        return {'StatusCode': 200, 'Payload': io.BytesIO(json.dumps(payload).encode('utf-8'))}
+
+
+class StubBedrockAgent:
+    """Streams a fixed completion"""
+
+    def __init__(self):
+        self.calls = []
+
+    def invoke_agent(self, **kwargs):
+        self.calls.append(kwargs)
+        return {'completion': [{'chunk': {'bytes': b'Agent reply'}}]}
+
+
+@pytest.fixture
+def bedrock_agent(monkeypatch):
+    agent = StubBedrockAgent()
+    monkeypatch.setattr(app, 'bedrock_agent', agent)
+    monkeypatch.setattr(app, 'TODOIST_TOOL_FUNCTION_NAME', 'todoist-tool')
+    return agent
+
+
+def _run(monkeypatch, lambda_client, input_text='complete task 123'):
+    monkeypatch.setattr(app, 'lambda_client', lambda_client)
+    return app._execute_request({'inputText': input_text, 'sessionId': 'session-1'}, 'acme', 'req-1')
+
+
+def test_success_returns_agent_shaped_result(monkeypatch, bedrock_agent):
+    tool = StubLambdaClient(200, {'success': True, 'message': 'Task completed'})
+    status_code, result = _run(monkeypatch, tool)
+
+    assert status_code == 200
+    assert result['completion'] == 'Task completed'
+    assert result['sessionId'] == 'session-1'
+    assert result['fastPath']['intent'] == 'complete_task'
+    assert not bedrock_agent.calls
+
+    event = json.loads(tool.calls[0]['Payload'])
+    assert event['sessionAttributes'] == {app.TENANT_ATTRIBUTE: 'acme'}
+    assert {'name': 'task_id', 'type': 'string', 'value': '123'} in event['parameters']
+
+
+def test_tool_rejection_falls_back_to_agent(monkeypatch, bedrock_agent):
+    tool = StubLambdaClient(400, {'success': False, 'message': "Project 'Gym' not found"})
+    status_code, result = _run(monkeypatch, tool, 'add milk to Gym')
+
+    assert status_code == 200
+    assert result['completion'] == 'Agent reply'
+    assert 'fastPath' not in result
+    assert len(bedrock_agent.calls) == 1
+
+
+def test_invoke_error_falls_back_to_agent(monkeypatch, bedrock_agent):
+    error = ClientError({'Error': {'Code': 'TooManyRequestsException', 'Message': 'Throttled'}}, 'Invoke')
+    status_code, result = _run(monkeypatch, StubLambdaClient(error=error))
+
+    assert status_code == 200
+    assert result['completion'] == 'Agent reply'
+    assert len(bedrock_agent.calls) == 1
+
+
+def test_rate_limit_is_passed_through(monkeypatch, bedrock_agent):
+    tool = StubLambdaClient(429, {'success': False, 'message': "Rate limit exceeded for tenant 'acme'"})
+    status_code, result = _run(monkeypatch, tool)
+
+    assert status_code == 429
+    assert result['message'] == "Rate limit exceeded for tenant 'acme'"
+    assert not bedrock_agent.calls
+
+
+def test_tool_failure_is_explained_without_rerunning(monkeypatch, bedrock_agent):
+    tool = StubLambdaClient(500, {'success': False, 'message': 'Operation failed'})
+    status_code, result = _run(monkeypatch, tool)
+
+    assert status_code == 200
+    assert result['completion'] == "Sorry, I couldn't complete task 123: Operation failed."
+    assert result['fastPath']['error'] == {'statusCode': 500, 'message': 'Operation failed'}
+    assert not bedrock_agent.calls
+
+
+def test_agent_only_parameters_skip_fast_path(monkeypatch, bedrock_agent):
+    tool = StubLambdaClient(200, {'success': True, 'message': 'Task completed'})
+    monkeypatch.setattr(app, 'lambda_client', tool)
+    body = {'inputText': 'complete task 123', 'sessionId': 'session-1', 'enableTrace': True}
+
+    status_code, result = app._execute_request(body, 'acme', 'req-1')
+
+    assert status_code == 200
+    assert result['completion'] == 'Agent reply'
+    assert not tool.calls
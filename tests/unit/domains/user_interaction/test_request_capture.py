@@ -0,0 +1,55 @@
+"""
+Unit tests for what the user request handler keeps when capturing API Gateway traffic
+"""
+
+import json
+
+from common_libs import traffic_capture
+
+import app
+
+
+def test_event_keeps_only_replayable_parts():
+    event = {
+        'httpMethod': 'POST',
+        'path': '/invoke-agent',
+        'headers': {'Authorization': 'Bearer abc', 'X-Forwarded-For': '10.0.0.1'},
+        'multiValueHeaders': {'Cookie': ['c']},
+        'requestContext': {
+            'identity': {'sourceIp': '10.0.0.1'},
+            'authorizer': {'claims': {'sub': 'user-123', 'email': 'alice@example.com'}}
+        },
+        'body': json.dumps({'inputText': 'hi', 'sessionId': 'session-1'})
+    }
+
+    sanitized = app._sanitize_event(event)
+
+    assert sanitized == {
+        'httpMethod': 'POST',
+        'path': '/invoke-agent',
+        'body': {'inputText': 'hi', 'sessionId': 'session-1'},
+        'requestContext': {'authorizer': {app.TENANT_ATTRIBUTE: traffic_capture.pseudonymize('user-123')}}
+    }
+
+
+def test_sensitive_body_fields_are_redacted_once_captured():
+    event = {'httpMethod': 'POST', 'body': json.dumps({'inputText': 'hi', 'apiKey': 'k'})}
+
+    captured = traffic_capture.redact(app._sanitize_event(event))
+
+    assert captured['body'] == {'inputText': 'hi', 'apiKey': '[REDACTED]'}
+    assert 'requestContext' not in captured
+
+
+def test_unparseable_body_is_kept_as_text():
+    assert app._sanitize_event({'body': 'not json'}) == {'body': 'not json'}
+
+
+def test_background_job_invocations_are_not_captured():
+    assert app._sanitize_event({'asyncJob': {'jobId': 'job-1', 'body': {}}}) is None
+
+
+def test_response_drops_headers_and_parses_body():
+    response = {'statusCode': 200, 'headers': {'Access-Control-Allow-Origin': '*'}, 'body': '{"completion": "ok"}'}
+
+    assert app._sanitize_response(response) == {'statusCode': 200, 'body': {'completion': 'ok'}}
@@ -0,0 +1,72 @@
+"""
+Unit tests for how the user request handler keeps Bedrock sessions apart per tenant
+"""
+
+import pytest
+
+import app
+
+
+def test_session_ids_are_namespaced_per_tenant():
+    alice = app._scope_to_tenant('session-1', 'alice')
+    bob = app._scope_to_tenant('session-1', 'bob')
+
+    assert alice != bob
+    assert alice.endswith(':session-1') and bob.endswith(':session-1')
+    assert 'alice' not in alice
+    assert app._scope_to_tenant('session-1', 'alice') == alice
+
+
+def test_anonymous_callers_cannot_reach_tenant_sessions():
+    tenant_session = app._scope_to_tenant('session-1', 'alice')
+
+    # Even a client that sends another tenant's full, prefixed ID stays in its own namespace
+    assert app._scope_to_tenant(tenant_session, None) == f"{app.ANONYMOUS_NAMESPACE}:{tenant_session}"
+
+
+def test_invoke_params_use_scoped_ids_and_authenticated_tenant():
+    body = {
+        'inputText': 'what is due today',
+        'sessionId': 'session-1',
+        'memoryId': 'memory-1',
+        'sessionState': {'sessionAttributes': {app.TENANT_ATTRIBUTE: 'bob', 'locale': 'en'}}
+    }
+
+    params = app._build_invoke_params(body, 'alice')
+
+    assert params['sessionId'] == app._scope_to_tenant('session-1', 'alice')
+    assert params['memoryId'] == app._scope_to_tenant('memory-1', 'alice')
+    assert params['sessionState']['sessionAttributes'] == {app.TENANT_ATTRIBUTE: 'alice', 'locale': 'en'}
+
+
+def test_tenant_attribute_is_always_sent():
+    params = app._build_invoke_params({'inputText': 'hi', 'sessionId': 'session-1'}, None)
+
+    # An empty value overwrites any tenant a previous turn stored on the session
+    assert params['sessionState'] == {'sessionAttributes': {app.TENANT_ATTRIBUTE: ''}}
+    assert params['sessionId'] == f"{app.ANONYMOUS_NAMESPACE}:session-1"
+
+
+@pytest.mark.parametrize('session_id', ['ab\n', 'a', 'has space', 'x' * 81, 42])
+def test_invalid_session_ids_are_rejected(session_id):
+    errors = app._validate_request_body({'inputText': 'hi', 'agentId': 'agent', 'sessionId': session_id})
+
+    assert 'sessionId' in errors
+
+
+def test_valid_session_id_is_accepted():
+    body = {'inputText': 'hi', 'agentId': 'agent', 'sessionId': 'c0ffee:session-1.a_b'}
+
+    assert app._validate_request_body(body) == {}
+
+
+@pytest.mark.parametrize('authorizer, tenant_id', [
+    ({app.TENANT_ATTRIBUTE: 'acme', 'principalId': 'user'}, 'acme'),
+    ({'claims': {'sub': 'cognito-sub'}, 'principalId': 'user'}, 'cognito-sub'),
+    ({'principalId': 'user'}, 'user'),
+    ({}, None),
+])
+def test_tenant_comes_from_authorizer_only(authorizer, tenant_id):
+    event = {'requestContext': {'authorizer': authorizer}, 'body': '{"tenantId": "spoofed"}'}
+
+    assert app._resolve_tenant_id(event) == tenant_id